@@ -12,7 +12,7 @@ from dataclasses import dataclass
 import pyarrow as pa
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulkInsertFromArrowTableCommand:
     """Command to insert bulk data from Arrow Table"""
     schema_name: str
@@ -23,7 +23,7 @@ class BulkInsertFromArrowTableCommand:
             raise ValueError("Schema name is required")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulkReadToArrowCommand:
     """Command to read bulk data as Arrow Table"""
     schema_name: str
@@ -33,7 +33,7 @@ class BulkReadToArrowCommand:
             raise ValueError("Schema name is required")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulkUpdateFromArrowTableCommand:
     """Command to update bulk data from Arrow Table"""
     schema_name: str
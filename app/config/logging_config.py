@@ -45,6 +45,10 @@ def sanitize_log_message(message: str) -> str:
     Sanitize log messages to replace Unicode characters that might cause encoding issues.
     This is a fallback for Windows systems with cp1252 encoding.
     """
+    # Most messages are plain ASCII and contain nothing to replace
+    if message.isascii():
+        return message
+
     # Replace common Unicode characters with ASCII equivalents
     replacements = {
         '🚀': '[ROCKET]',
@@ -2,14 +2,48 @@
 import os
 import tempfile
 import platform
+from functools import cached_property, singledispatch
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+# Config keys that MUST be set at connection time; everything else is applied with SET
+DUCKDB_STARTUP_KEYS = frozenset({
+    'allow_unsigned_extensions',
+    'autoinstall_known_extensions',
+    'autoload_known_extensions',
+    'temp_directory'
+})
+
+
+@singledispatch
+def format_duckdb_setting(value: Any, key: str) -> str:
+    """Format one DuckDB SET statement; non-string values are rendered unquoted and lower-cased."""
+    return f"SET {key} = {str(value).lower()}"
+
+
+@format_duckdb_setting.register
+def _(value: str, key: str) -> str:
+    # SET command is picky about quotes for strings vs other types
+    return f"SET {key} = '{value}'"
+
+
+def build_duckdb_set_statements(config: Dict[str, Any]) -> Tuple[str, ...]:
+    """Format runtime config entries as DuckDB SET statements (None and empty strings are skipped)."""
+    return tuple(
+        format_duckdb_setting(value, key)
+        for key, value in config.items()
+        if value is not None and value != ''
+    )
+
 
 class Settings:
     PROJECT_NAME: str = "Data Forge"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     DATABASE_PATH: str = os.getenv("DATABASE_PATH", "./data/data.duckdb")
 
-    @property
-    def DUCKDB_PERFORMANCE_CONFIG(self):
+    @cached_property
+    def _duckdb_performance_config(self) -> Mapping[str, Any]:
+        # Built once per Settings instance and read-only, since every pool/partition connection shares it
         # Get platform-appropriate temp directory
         if platform.system() == "Windows":
             temp_dir = os.path.join(tempfile.gettempdir(), "duckdb")
@@ -19,7 +53,7 @@ class Settings:
         # Ensure temp directory exists
         os.makedirs(temp_dir, exist_ok=True)
         
-        return {
+        return MappingProxyType({
             'memory_limit': '8GB',           # Optimized for local use
             'threads': 4,                    # Fixed number for stability
             'enable_object_cache': True,
@@ -28,7 +62,32 @@ class Settings:
             'autoinstall_known_extensions': False,  # Disable auto-download
             'autoload_known_extensions': False,     # Disable auto-load
             'disabled_optimizers': '',       # Enable all optimizers
-        }
+        })
+
+    # duckdb.connect only accepts a real dict, so callers get a fresh copy they are free to modify
+    @property
+    def DUCKDB_PERFORMANCE_CONFIG(self) -> Dict[str, Any]:
+        return dict(self._duckdb_performance_config)
+
+    @property
+    def DUCKDB_STARTUP_CONFIG(self) -> Dict[str, Any]:
+        return {k: v for k, v in self._duckdb_performance_config.items() if k in DUCKDB_STARTUP_KEYS}
+
+    @property
+    def DUCKDB_RUNTIME_CONFIG(self) -> Dict[str, Any]:
+        return {k: v for k, v in self._duckdb_performance_config.items() if k not in DUCKDB_STARTUP_KEYS}
+
+    @cached_property
+    def DUCKDB_RUNTIME_SET_STATEMENTS(self) -> Tuple[str, ...]:
+        # Formatted once; connections just execute the prepared statements
+        return build_duckdb_set_statements(self.DUCKDB_RUNTIME_CONFIG)
+
+    # Response compression, negotiated per request via Accept-Encoding. Off by default: it trades
+    # server CPU for bytes, which only pays off when the client is on a slow link rather than localhost.
+    # Level 1 keeps most of the size reduction on repetitive columnar payloads at a fraction of the CPU cost
+    GZIP_ENABLED: bool = os.getenv("GZIP_ENABLED", "False").lower() == "true"
+    GZIP_MINIMUM_SIZE: int = int(os.getenv("GZIP_MINIMUM_SIZE", "1000"))
+    GZIP_COMPRESS_LEVEL: int = int(os.getenv("GZIP_COMPRESS_LEVEL", "1"))
 
     # High-performance settings
     DUCKDB_ARROW_EXTENSION_ENABLED: bool = os.getenv("DUCKDB_ARROW_EXTENSION_ENABLED", "True").lower() == "true"
@@ -1,9 +1,22 @@
 # app/domain/entities/schema.py
-from typing import List, Dict, Any, Literal, Optional
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import List, Dict, Any, FrozenSet, Literal, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from app.domain.exceptions import InvalidDataException
 
+# Python types accepted for each schema property type
+PYTHON_TYPES_BY_PROPERTY_TYPE: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
 class SchemaProperty(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: Literal["string", "integer", "number", "boolean", "array", "object"]
     db_type: str
@@ -12,6 +25,9 @@ class SchemaProperty(BaseModel):
     primary_key: bool = False  # New field to mark primary key components
 
 class Schema(BaseModel):
+    # Frozen: schema instances are shared between callers and the cached properties below assume they never change
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     table_name: str
@@ -26,19 +42,19 @@ class Schema(BaseModel):
         for prop in self.properties:
             if prop.name in data:
                 value = data[prop.name]
-                if prop.type == "string" and not isinstance(value, str):
-                    raise InvalidDataException(f"Field '{prop.name}' expected string, got {type(value).__name__}")
-                if prop.type == "integer" and not isinstance(value, int):
-                    raise InvalidDataException(f"Field '{prop.name}' expected integer, got {type(value).__name__}")
-                if prop.type == "number" and not isinstance(value, (int, float)):
-                    raise InvalidDataException(f"Field '{prop.name}' expected number, got {type(value).__name__}")
-                if prop.type == "boolean" and not isinstance(value, bool):
-                    raise InvalidDataException(f"Field '{prop.name}' expected boolean, got {type(value).__name__}")
-                if prop.type == "array" and not isinstance(value, list):
-                    raise InvalidDataException(f"Field '{prop.name}' expected array, got {type(value).__name__}")
-                if prop.type == "object" and not isinstance(value, dict):
-                    raise InvalidDataException(f"Field '{prop.name}' expected object, got {type(value).__name__}")
+                if not isinstance(value, PYTHON_TYPES_BY_PROPERTY_TYPE[prop.type]):
+                    raise InvalidDataException(f"Field '{prop.name}' expected {prop.type}, got {type(value).__name__}")
     
+    @cached_property
+    def property_names(self) -> Tuple[str, ...]:
+        """Property names in declaration order (computed once per schema)"""
+        return tuple(p.name for p in self.properties)
+
+    @cached_property
+    def primary_key_property_names(self) -> FrozenSet[str]:
+        """Names of properties flagged as primary key components (computed once per schema)"""
+        return frozenset(p.name for p in self.properties if p.primary_key)
+
     def get_composite_key_from_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract composite key values from data based on schema definition"""
         if not self.primary_key:
@@ -46,15 +62,14 @@ class Schema(BaseModel):
         
         composite_key = {}
         missing_pk_fields = []
+        pk_property_names = self.primary_key_property_names
         
         for key_field in self.primary_key:
             if key_field in data:
                 composite_key[key_field] = data[key_field]
-            else:
-                # Check if it's a required primary key field
-                prop = next((p for p in self.properties if p.name == key_field), None)
-                if prop and prop.primary_key:
-                    missing_pk_fields.append(key_field)
+            elif key_field in pk_property_names:
+                # Required primary key field is missing
+                missing_pk_fields.append(key_field)
         
         if missing_pk_fields:
             raise InvalidDataException(f"Primary key field(s) {', '.join(missing_pk_fields)} are required but missing")
@@ -3,6 +3,8 @@
 # This file defines the schemas for the application.
 # The schemas are defined as a list of dictionaries, which are then used to create Schema objects.
 
+from types import MappingProxyType
+
 SCHEMAS_METADATA = [
     {
         "name": "fields_aliases",
@@ -36,4 +38,9 @@ SCHEMAS_METADATA = [
             {"name": "partition_0", "type": "string", "db_type": "VARCHAR"},
         ],
     }
-]
\ No newline at end of file
+]
+
+# Name -> metadata index so callers can look a schema up directly instead of scanning the list.
+# Exposed as a read-only view so it can be shared without defensive copies.
+SCHEMAS_METADATA_BY_NAME = MappingProxyType({schema["name"]: schema for schema in SCHEMAS_METADATA})
+SCHEMA_NAMES = tuple(SCHEMAS_METADATA_BY_NAME)
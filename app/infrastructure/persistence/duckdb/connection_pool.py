@@ -18,19 +18,8 @@ class AsyncDuckDBPool:
             if self._connection is None:
                 logger.info(f"Initializing DuckDB connection to database: {settings.DATABASE_PATH}")
                 
-                full_config = settings.DUCKDB_PERFORMANCE_CONFIG
-                
-                # Config keys that MUST be set at connection time
-                startup_keys = {
-                    'allow_unsigned_extensions',
-                    'autoinstall_known_extensions',
-                    'autoload_known_extensions',
-                    'temp_directory'
-                }
-                
-                # Separate configs
-                startup_config = {k: v for k, v in full_config.items() if k in startup_keys}
-                runtime_config = {k: v for k, v in full_config.items() if k not in startup_keys}
+                startup_config = settings.DUCKDB_STARTUP_CONFIG
+                runtime_config = settings.DUCKDB_RUNTIME_CONFIG
 
                 # duckdb.connect handles typing for its config dict
                 logger.info(f"Applying DuckDB startup config: {startup_config}")
@@ -41,15 +30,8 @@ class AsyncDuckDBPool:
                 )
 
                 logger.info(f"Applying DuckDB runtime settings: {runtime_config}")
-                for key, value in runtime_config.items():
-                    if value is not None:
-                        # SET command is picky about quotes for strings vs other types
-                        if isinstance(value, str):
-                            # Don't set empty strings. For `disabled_optimizers`, empty is default.
-                            if value:
-                                self._connection.execute(f"SET {key} = '{value}'")
-                        else:
-                            self._connection.execute(f"SET {key} = {str(value).lower()}")
+                for statement in settings.DUCKDB_RUNTIME_SET_STATEMENTS:
+                    self._connection.execute(statement)
 
                 # Load extensions if needed, e.g., arrow
                 if settings.DUCKDB_ARROW_EXTENSION_ENABLED:
@@ -76,7 +76,7 @@ class PartitionConfig:
         if not partition_name.startswith("partition_"):
             raise ValueError(f"Invalid partition name format: {partition_name}")
         
-        parts = partition_name.replace("partition_", "").split("_")
+        parts = partition_name.removeprefix("partition_").split("_")
         
         if self.strategy == PartitionStrategy.YEARLY:
             year = int(parts[0])
@@ -91,7 +91,7 @@ class PartitionConfig:
                 end_date = datetime(year, month + 1, 1) - timedelta(microseconds=1)
         elif self.strategy == PartitionStrategy.WEEKLY:
             year = int(parts[0])
-            week = int(parts[1].replace("w", ""))
+            week = int(parts[1].removeprefix("w"))
             start_date = datetime.strptime(f'{year} {week} 1', '%Y %W %w')
             end_date = start_date + timedelta(days=7) - timedelta(microseconds=1)
         elif self.strategy == PartitionStrategy.DAILY:
@@ -115,7 +115,7 @@ class PartitionConfig:
         partitions = []
         for file in os.listdir(self.partition_directory):
             if file.endswith('.duckdb') and file.startswith('partition_'):
-                partition_name = file.replace('.duckdb', '')
+                partition_name = file.removesuffix('.duckdb')
                 partitions.append(partition_name)
         
         return sorted(partitions)
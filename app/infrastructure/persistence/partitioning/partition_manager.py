@@ -3,13 +3,62 @@
 import asyncio
 import duckdb
 import os
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, List, Optional, Any, Set, TypeVar
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from app.infrastructure.persistence.partitioning.partition_config import PartitionConfig, DEFAULT_PARTITION_CONFIG
 from app.domain.entities.schema import Schema
 from app.config.logging_config import logger
-from app.config.settings import settings
+from app.config.settings import settings, build_duckdb_set_statements
+
+# Runtime settings applied to every partition connection, formatted once at import
+_PARTITION_RUNTIME_STATEMENTS = build_duckdb_set_statements({
+    'memory_limit': '8GB',
+    'threads': 8,
+    'enable_object_cache': True,
+    'disabled_optimizers': '',
+})
+
+T = TypeVar("T")
+
+# Non-ISO timestamp formats tried when datetime.fromisoformat rejects the input
+_FALLBACK_TIMESTAMP_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f")
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse a partition timestamp string; memoized because batches repeat the same periods many times."""
+    try:
+        # One C-level parse covers all the ISO variants we receive, including offsets and 'Z'
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        # Fallback: handle looser timestamp formats
+        for fmt in _FALLBACK_TIMESTAMP_FORMATS:
+            try:
+                return datetime.strptime(timestamp_str, fmt)
+            except ValueError:
+                continue
+        raise
+
+
+def _call_on_cursor(connection: duckdb.DuckDBPyConnection, fn: Callable[..., T], *args: Any) -> T:
+    """Call fn(cursor, *args) on a fresh cursor of `connection`, closing the cursor afterwards."""
+    cursor = connection.cursor()
+    try:
+        return fn(cursor, *args)
+    finally:
+        cursor.close()
+
+
+async def run_on_cursor(connection: duckdb.DuckDBPyConnection, fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run blocking DuckDB work in a worker thread on its own cursor of a shared connection.
+    
+    A connection holds a single pending result, so two threads executing on it interleave their
+    results; a cursor is an independent connection to the same database.
+    """
+    return await asyncio.to_thread(_call_on_cursor, connection, fn, *args)
 
 
 class PartitionManager:
@@ -22,10 +71,14 @@ class PartitionManager:
     - Cross-partition queries
     - Performance optimization for massive datasets
     """
-    
+
+    __slots__ = ("config", "_partition_connections", "_connection_refs", "_connection_lock", "_main_connection")
+
     def __init__(self, partition_config: PartitionConfig = DEFAULT_PARTITION_CONFIG):
         self.config = partition_config
         self._partition_connections: Dict[str, duckdb.DuckDBPyConnection] = {}
+        # Active acquire_partition_connection holders per partition; pinned connections are never evicted
+        self._connection_refs: Dict[str, int] = {}
         self._connection_lock = asyncio.Lock()
         self._main_connection: Optional[duckdb.DuckDBPyConnection] = None
         
@@ -52,19 +105,8 @@ class PartitionManager:
     
     async def _apply_runtime_settings(self, connection: duckdb.DuckDBPyConnection):
         """Apply DuckDB runtime settings for optimal performance."""
-        runtime_config = {
-            'memory_limit': '8GB',
-            'threads': 8,
-            'enable_object_cache': True,
-            'disabled_optimizers': '',
-        }
-        
-        for key, value in runtime_config.items():
-            if value is not None:
-                if isinstance(value, str) and value:
-                    connection.execute(f"SET {key} = '{value}'")
-                elif not isinstance(value, str):
-                    connection.execute(f"SET {key} = {str(value).lower()}")
+        for statement in _PARTITION_RUNTIME_STATEMENTS:
+            connection.execute(statement)
     
     async def get_partition_connection(self, partition_name: str) -> duckdb.DuckDBPyConnection:
         """Get or create a connection to a specific partition."""
@@ -92,17 +134,22 @@ class PartitionManager:
                 
                 self._partition_connections[partition_name] = connection
                 
-                # Manage connection pool size
-                await self._manage_connection_pool()
+                # Manage connection pool size; the connection just opened is about to be returned
+                await self._manage_connection_pool(keep=partition_name)
             
             return self._partition_connections[partition_name]
     
-    async def _manage_connection_pool(self):
+    async def _manage_connection_pool(self, keep: Optional[str] = None):
         """Manage the size of the connection pool to prevent memory issues."""
-        if len(self._partition_connections) > self.config.max_partitions_in_memory:
-            # Close oldest connections
-            oldest_partitions = list(self._partition_connections.keys())[:-self.config.max_partitions_in_memory]
-            for partition_name in oldest_partitions:
+        excess = len(self._partition_connections) - self.config.max_partitions_in_memory
+        if excess > 0:
+            # Close the oldest connections that are not currently acquired; if every candidate is
+            # in use the pool stays over the limit until one is released and the next open trims it
+            idle_partitions = [
+                partition_name for partition_name in self._partition_connections
+                if partition_name != keep and not self._connection_refs.get(partition_name)
+            ]
+            for partition_name in idle_partitions[:excess]:
                 try:
                     self._partition_connections[partition_name].close()
                     del self._partition_connections[partition_name]
@@ -133,12 +180,12 @@ class PartitionManager:
         """Create the table schema in a partition."""
         try:
             # Build column definitions
-            column_defs = ", ".join([f'"{prop.name}" {prop.db_type}' for prop in schema.properties])
+            column_defs = ", ".join(f'"{prop.name}" {prop.db_type}' for prop in schema.properties)
             
-            # Build composite primary key constraint if defined
+            # Build composite primary key constraint if defined; the quoted column list is reused for the index below
             composite_pk_constraint = ""
-            if schema.primary_key:
-                pk_columns = ", ".join([f'"{col}"' for col in schema.primary_key])
+            pk_columns = ", ".join(f'"{col}"' for col in schema.primary_key) if schema.primary_key else ""
+            if pk_columns:
                 composite_pk_constraint = f", UNIQUE({pk_columns})"
             
             create_table_sql = f"""
@@ -158,8 +205,7 @@ class PartitionManager:
             connection.execute(f'CREATE INDEX IF NOT EXISTS "idx_{schema.table_name}_{self.config.partition_column}" ON "{schema.table_name}"({self.config.partition_column});')
             
             # Create composite key index for performance
-            if schema.primary_key:
-                pk_columns = ", ".join([f'"{col}"' for col in schema.primary_key])
+            if pk_columns:
                 connection.execute(f'CREATE INDEX IF NOT EXISTS "idx_{schema.table_name}_composite_key" ON "{schema.table_name}"({pk_columns});')
             
             logger.info(f"Table {schema.table_name} created in partition with indexes")
@@ -215,16 +261,8 @@ class PartitionManager:
         try:
             # Parse timestamp string
             if isinstance(timestamp_str, str):
-                # Handle various timestamp formats
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f"]:
-                    try:
-                        date = datetime.strptime(timestamp_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # Fallback: try parsing as ISO format
-                    date = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                # Unparseable strings raise and are not cached, so they still hit the fallback below
+                date = _parse_timestamp(timestamp_str)
             else:
                 date = timestamp_str
             
@@ -293,13 +331,18 @@ class PartitionManager:
     
     @asynccontextmanager
     async def acquire_partition_connection(self, partition_name: str):
-        """Context manager for acquiring a partition connection."""
-        connection = await self.get_partition_connection(partition_name)
+        """Context manager for acquiring a partition connection, pinned in the pool while held."""
+        # Pin before opening so a concurrent open of another partition cannot evict it mid-use
+        self._connection_refs[partition_name] = self._connection_refs.get(partition_name, 0) + 1
         try:
-            yield connection
+            yield await self.get_partition_connection(partition_name)
         finally:
-            # Connection is managed by the pool, no need to close here
-            pass
+            # Connection is managed by the pool, no need to close here; only the pin is released
+            remaining = self._connection_refs[partition_name] - 1
+            if remaining:
+                self._connection_refs[partition_name] = remaining
+            else:
+                del self._connection_refs[partition_name]
     
     @asynccontextmanager 
     async def acquire_main_connection(self):
@@ -11,6 +11,10 @@ from app.infrastructure.persistence.duckdb.connection_pool import AsyncDuckDBPoo
 from app.domain.entities.schema import Schema
 from app.config.logging_config import logger
 
+# Partitions written at once per migration batch. Each insert holds its connection through
+# acquire_partition_connection, which pins it against pool eviction while the insert runs
+MAX_CONCURRENT_PARTITION_INSERTS = 4
+
 
 class PartitionMigrator:
     """
@@ -168,15 +172,16 @@ class PartitionMigrator:
         partition_counts = {}
         
         async with self.main_connection_pool.acquire() as conn:
-            # Get all data ordered by partition column for efficient processing
+            # Get all data ordered by partition column for efficient processing; id breaks ties so the
+            # order is total and LIMIT/OFFSET pages neither repeat nor skip rows sharing a timestamp
             if self.config.partition_column:
-                select_sql = f'SELECT * FROM "{schema.table_name}" ORDER BY "{self.config.partition_column}"'
+                select_sql = f'SELECT * FROM "{schema.table_name}" ORDER BY "{self.config.partition_column}", id'
             else:
-                select_sql = f'SELECT * FROM "{schema.table_name}" ORDER BY created_at'
+                select_sql = f'SELECT * FROM "{schema.table_name}" ORDER BY created_at, id'
             
-            # Process data in batches
-            offset = 0
-            while True:
+            # Process data in batches; the row count from the analysis step bounds the loop,
+            # so no trailing empty page is fetched just to detect the end
+            for offset in range(0, stats["total_records"], batch_size):
                 batch_sql = f"{select_sql} LIMIT {batch_size} OFFSET {offset}"
                 result = conn.execute(batch_sql)
                 rows = result.fetchall()
@@ -187,75 +192,89 @@ class PartitionMigrator:
                 # Process this batch
                 await self._migrate_batch(schema, rows, result.description, partition_counts)
                 
-                offset += len(rows)
                 stats["migrated_records"] += len(rows)
                 
-                if offset % (batch_size * 10) == 0:  # Log progress every 10 batches
-                    logger.info(f"Migrated {offset} records so far...")
+                if (offset + len(rows)) % (batch_size * 10) == 0:  # Log progress every 10 batches
+                    logger.info(f"Migrated {offset + len(rows)} records so far...")
         
         stats["partitions_created"] = len(partition_counts)
         logger.info(f"Created partitions: {list(partition_counts.keys())}")
     
     async def _migrate_batch(self, schema: Schema, rows: List, description, partition_counts: Dict[str, int]):
         """Migrate a batch of rows to appropriate partitions."""
-        # Group rows by partition
+        # Group the fetched row tuples by partition; they are inserted positionally,
+        # so no per-row dict is built
         partition_groups = {}
         
         column_names = [desc[0] for desc in description]
+        partition_index = column_names.index(self.config.partition_column) if self.config.partition_column in column_names else None
+        created_at_index = column_names.index('created_at') if 'created_at' in column_names else None
         
         for row in rows:
-            row_dict = dict(zip(column_names, row))
-            
             # Determine target partition
-            partition_name = self._get_partition_for_row(row_dict)
+            partition_name = self._get_partition_for_row(row, partition_index, created_at_index)
             
             if partition_name not in partition_groups:
                 partition_groups[partition_name] = []
             
-            partition_groups[partition_name].append(row_dict)
+            partition_groups[partition_name].append(row)
+        
+        # Insert into the partitions concurrently; each partition has its own connection
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARTITION_INSERTS)
+        
+        async def insert_group(partition_name: str, partition_rows: List[tuple]):
+            async with semaphore:
+                await self._insert_into_partition(schema, partition_name, column_names, partition_rows)
+        
+        # Let every insert settle before surfacing a failure: an executemany already running in a
+        # worker thread can't be cancelled, and the caller closes the partition connections on error
+        results = await asyncio.gather(*(
+            insert_group(partition_name, partition_rows)
+            for partition_name, partition_rows in partition_groups.items()
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
-        # Insert into each partition
         for partition_name, partition_rows in partition_groups.items():
-            await self._insert_into_partition(schema, partition_name, partition_rows)
-            
             # Update statistics
             if partition_name not in partition_counts:
                 partition_counts[partition_name] = 0
             partition_counts[partition_name] += len(partition_rows)
     
-    def _get_partition_for_row(self, row_dict: Dict[str, Any]) -> str:
+    def _get_partition_for_row(self, row: tuple, partition_index: Optional[int], created_at_index: Optional[int]) -> str:
         """Determine which partition a row should go to."""
-        if self.config.partition_column and self.config.partition_column in row_dict:
-            timestamp_value = row_dict[self.config.partition_column]
+        if partition_index is not None:
+            timestamp_value = row[partition_index]
             if timestamp_value:
-                return self.partition_manager.get_partition_for_timestamp(str(timestamp_value))
+                return self._partition_for_value(timestamp_value)
         
         # Fallback to created_at or current time
-        if 'created_at' in row_dict and row_dict['created_at']:
-            return self.partition_manager.get_partition_for_timestamp(str(row_dict['created_at']))
+        if created_at_index is not None and row[created_at_index]:
+            return self._partition_for_value(row[created_at_index])
         
         return self.config.get_partition_name(datetime.now())
     
-    async def _insert_into_partition(self, schema: Schema, partition_name: str, rows: List[Dict[str, Any]]):
+    def _partition_for_value(self, timestamp_value: Any) -> str:
+        """Resolve a partition name, skipping string parsing for values DuckDB already returned as datetimes."""
+        if isinstance(timestamp_value, datetime):
+            return self.config.get_partition_for_date(timestamp_value)
+        return self.partition_manager.get_partition_for_timestamp(str(timestamp_value))
+    
+    async def _insert_into_partition(self, schema: Schema, partition_name: str, columns: List[str], rows: List[tuple]):
         """Insert rows into a specific partition."""
-        # Ensure partition exists
-        await self.partition_manager.ensure_partition_exists(partition_name, schema)
-          # Insert data
+        # Pin the connection first so it stays open from the schema check through the insert
         async with self.partition_manager.acquire_partition_connection(partition_name) as conn:
+            await self.partition_manager.ensure_partition_exists(partition_name, schema)
+            
             # Build insert SQL
-            columns = list(rows[0].keys())
             placeholders = ", ".join(["?" for _ in columns])
             quoted_columns = ", ".join([f'"{col}"' for col in columns])
             insert_sql = f'INSERT OR IGNORE INTO "{schema.table_name}" ({quoted_columns}) VALUES ({placeholders})'
             
-            # Prepare data for batch insert
-            values_list = []
-            for row in rows:
-                values = [row.get(col) for col in columns]
-                values_list.append(values)
-            
-            # Batch insert
-            conn.executemany(insert_sql, values_list)
+            # Batch insert off the event loop so inserts into other partitions can overlap;
+            # rows are in the same column order as the SELECT they came from
+            await asyncio.to_thread(conn.executemany, insert_sql, rows)
     
     async def _verify_migration(self, schema: Schema, stats: Dict[str, Any]):
         """Verify that migration was successful."""
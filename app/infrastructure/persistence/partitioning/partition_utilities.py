@@ -2,7 +2,9 @@
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import math
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, TextIO
 from datetime import datetime, timedelta
 from app.infrastructure.persistence.partitioning.partition_config import PartitionConfig, DEFAULT_PARTITION_CONFIG
 from app.infrastructure.persistence.partitioning.partition_manager import PartitionManager
@@ -12,6 +14,39 @@ from app.domain.entities.schema import Schema
 from app.config.logging_config import logger
 
 
+# (minimum share of passing health checks, grade), best grade first; anything below is "poor"
+HEALTH_GRADES = ((1.0, "excellent"), (0.75, "good"), (0.5, "fair"))
+
+
+@lru_cache(maxsize=256)
+def format_check_name(name: str) -> str:
+    """Human-readable label for a health-check or metric key, e.g. 'date_ranges_valid' -> 'Date Ranges Valid'."""
+    return name.replace('_', ' ').title()
+
+
+def _indent_json(value: Any, depth: int) -> str:
+    """Serialize value as indent=2 JSON nested `depth` spaces deep (json.dumps never emits raw newlines inside strings)."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + " " * depth)
+
+
+def _summarize_sizes(partition_sizes: Dict[str, float]) -> Dict[str, Any]:
+    """Total, extremes and their partition names for a name -> size mapping, gathered in one pass."""
+    summary = {
+        "total": 0,
+        "max": -math.inf,
+        "min": math.inf,
+        "largest": None,
+        "smallest": None,
+    }
+    for partition_name, size in partition_sizes.items():
+        summary["total"] += size
+        if size > summary["max"]:
+            summary["max"], summary["largest"] = size, partition_name
+        if size < summary["min"]:
+            summary["min"], summary["smallest"] = size, partition_name
+    return summary
+
+
 class PartitionUtilities:
     """
     Utility functions for managing partitioned databases.
@@ -56,22 +91,22 @@ class PartitionUtilities:
                 partition_analysis = await self._analyze_single_partition(partition_name, schema)
                 analysis["partition_analysis"][partition_name] = partition_analysis
                 
-                size_mb = partition_analysis.get("size_mb", 0)
-                partition_sizes[partition_name] = size_mb
-                analysis["summary"]["total_size_mb"] += size_mb
+                partition_sizes[partition_name] = partition_analysis.get("size_mb", 0)
                 
             except Exception as e:
                 logger.warning(f"Error analyzing partition {partition_name}: {e}")
                 analysis["partition_analysis"][partition_name] = {"error": str(e)}
         
-        # Calculate summary statistics
+        # Calculate summary statistics; the recommendations reuse the same aggregate
         if partition_sizes:
-            analysis["summary"]["average_size_mb"] = analysis["summary"]["total_size_mb"] / len(partition_sizes)
-            analysis["summary"]["largest_partition"] = max(partition_sizes, key=partition_sizes.get)
-            analysis["summary"]["smallest_partition"] = min(partition_sizes, key=partition_sizes.get)
+            size_summary = _summarize_sizes(partition_sizes)
+            analysis["summary"]["total_size_mb"] = size_summary["total"]
+            analysis["summary"]["average_size_mb"] = size_summary["total"] / len(partition_sizes)
+            analysis["summary"]["largest_partition"] = size_summary["largest"]
+            analysis["summary"]["smallest_partition"] = size_summary["smallest"]
             
             # Generate recommendations
-            analysis["summary"]["performance_recommendations"] = self._generate_performance_recommendations(partition_sizes)
+            analysis["summary"]["performance_recommendations"] = self._generate_performance_recommendations(partition_sizes, size_summary)
         
         return analysis
     
@@ -119,27 +154,29 @@ class PartitionUtilities:
         
         return analysis
     
-    def _generate_performance_recommendations(self, partition_sizes: Dict[str, float]) -> List[str]:
+    def _generate_performance_recommendations(self, partition_sizes: Dict[str, float],
+                                              size_summary: Optional[Dict[str, Any]] = None) -> List[str]:
         """Generate performance recommendations based on partition analysis."""
         recommendations = []
         
         if not partition_sizes:
             return recommendations
         
+        if size_summary is None:
+            size_summary = _summarize_sizes(partition_sizes)
+        max_size = size_summary["max"]
+        min_size = size_summary["min"]
+        
         # Check for very large partitions
-        max_size = max(partition_sizes.values())
         if max_size > 2000:  # 2GB
-            largest_partition = max(partition_sizes, key=partition_sizes.get)
-            recommendations.append(f"Partition {largest_partition} is very large ({max_size:.1f}MB). Consider using a finer partitioning strategy.")
+            recommendations.append(f"Partition {size_summary['largest']} is very large ({max_size:.1f}MB). Consider using a finer partitioning strategy.")
         
         # Check for very small partitions
-        min_size = min(partition_sizes.values())
         if min_size < 10:  # 10MB
-            smallest_partition = min(partition_sizes, key=partition_sizes.get)
-            recommendations.append(f"Partition {smallest_partition} is very small ({min_size:.1f}MB). Consider using a coarser partitioning strategy.")
+            recommendations.append(f"Partition {size_summary['smallest']} is very small ({min_size:.1f}MB). Consider using a coarser partitioning strategy.")
         
         # Check for uneven distribution
-        avg_size = sum(partition_sizes.values()) / len(partition_sizes)
+        avg_size = size_summary["total"] / len(partition_sizes)
         size_variance = sum((size - avg_size) ** 2 for size in partition_sizes.values()) / len(partition_sizes)
         size_std = size_variance ** 0.5
         
@@ -300,8 +337,7 @@ class PartitionUtilities:
             existing_partitions = self.config.list_existing_partitions()
             report["partition_count"] = len(existing_partitions)
             
-            total_size = 0
-            size_list = []
+            partition_sizes = {}
             
             for partition_name in existing_partitions:
                 partition_health = await self._check_partition_health(partition_name, schema)
@@ -314,32 +350,27 @@ class PartitionUtilities:
                 if partition_health.get("date_range_error"):
                     report["health_checks"]["date_ranges_valid"] = False
                 
-                size_mb = partition_health.get("size_mb", 0)
-                total_size += size_mb
-                size_list.append(size_mb)
+                partition_sizes[partition_name] = partition_health.get("size_mb", 0)
             
-            report["total_size_gb"] = total_size / 1024
+            # Same size aggregate as analyze_partition_performance
+            size_summary = _summarize_sizes(partition_sizes)
+            report["total_size_gb"] = size_summary["total"] / 1024
             
             # Check size distribution
-            if size_list:
-                avg_size = sum(size_list) / len(size_list)
-                max_size = max(size_list)
-                min_size = min(size_list)
+            if partition_sizes:
+                avg_size = size_summary["total"] / len(partition_sizes)
                 
                 # Flag if there's extreme size variation
-                if max_size > avg_size * 10 or min_size < avg_size * 0.1:
+                if size_summary["max"] > avg_size * 10 or size_summary["min"] < avg_size * 0.1:
                     report["health_checks"]["reasonable_size_distribution"] = False
             
             # Determine overall health
             health_score = sum(report["health_checks"].values())
-            if health_score == len(report["health_checks"]):
-                report["overall_health"] = "excellent"
-            elif health_score >= len(report["health_checks"]) * 0.75:
-                report["overall_health"] = "good"
-            elif health_score >= len(report["health_checks"]) * 0.5:
-                report["overall_health"] = "fair"
-            else:
-                report["overall_health"] = "poor"
+            check_count = len(report["health_checks"])
+            report["overall_health"] = next(
+                (grade for min_ratio, grade in HEALTH_GRADES if health_score >= check_count * min_ratio),
+                "poor"
+            )
             
             # Generate recommendations
             report["recommendations"] = self._generate_health_recommendations(report)
@@ -429,60 +460,85 @@ class PartitionUtilities:
     
     async def export_partition_metadata(self, output_file: str) -> Dict[str, Any]:
         """Export partition metadata to a JSON file."""
+        # Stream into a sibling temp file and swap it in, so a failed export never leaves a truncated file
+        temp_file = f"{output_file}.tmp"
         try:
-            existing_partitions = self.config.list_existing_partitions()
-            
-            metadata = {
-                "export_timestamp": datetime.now().isoformat(),
-                "partition_config": {
-                    "strategy": self.config.strategy.value,
-                    "partition_column": self.config.partition_column,
-                    "base_path": self.config.base_partition_path
-                },
-                "partitions": []
-            }
-            
-            for partition_name in existing_partitions:
-                try:
-                    partition_path = self.config.get_partition_path(partition_name)
-                    
-                    partition_info = {
-                        "name": partition_name,
-                        "path": partition_path,
-                        "exists": os.path.exists(partition_path)
-                    }
-                    
-                    if partition_info["exists"]:
-                        partition_info["size_mb"] = os.path.getsize(partition_path) / (1024 * 1024)
-                        partition_info["last_modified"] = datetime.fromtimestamp(os.path.getmtime(partition_path)).isoformat()
-                        
-                        # Add date range
-                        try:
-                            start_date, end_date = self.config.get_date_range_for_partition(partition_name)
-                            partition_info["date_range"] = {
-                                "start": start_date.isoformat(),
-                                "end": end_date.isoformat()
-                            }
-                        except Exception as e:
-                            partition_info["date_range_error"] = str(e)
-                    
-                    metadata["partitions"].append(partition_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing partition {partition_name}: {e}")
-            
-            # Write to file
-            with open(output_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with open(temp_file, 'w') as f:
+                partitions_exported = self.write_partition_metadata(f)
+            os.replace(temp_file, output_file)
             
             logger.info(f"Exported partition metadata to {output_file}")
-            return {"success": True, "file": output_file, "partitions_exported": len(metadata["partitions"])}
+            return {"success": True, "file": output_file, "partitions_exported": partitions_exported}
             
         except Exception as e:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
             error_msg = f"Error exporting partition metadata: {e}"
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
     
+    def write_partition_metadata(self, fp: TextIO) -> int:
+        """
+        Write partition metadata as indented JSON to a text file object, one partition at a time.
+        
+        Each partition entry is serialized and written as soon as it is collected, so the export
+        never holds the full metadata document in memory. Returns the number of partitions written.
+        """
+        header = {
+            "export_timestamp": datetime.now().isoformat(),
+            "partition_config": {
+                "strategy": self.config.strategy.value,
+                "partition_column": self.config.partition_column,
+                "base_path": self.config.base_partition_path
+            }
+        }
+        
+        fp.write("{\n")
+        for key, value in header.items():
+            fp.write(f'  {json.dumps(key)}: {_indent_json(value, 2)},\n')
+        fp.write('  "partitions": [')
+        
+        partitions_exported = 0
+        for partition_name in self.config.list_existing_partitions():
+            try:
+                partition_info = self._collect_partition_metadata(partition_name)
+            except Exception as e:
+                logger.warning(f"Error processing partition {partition_name}: {e}")
+                continue
+            
+            fp.write(",\n    " if partitions_exported else "\n    ")
+            fp.write(_indent_json(partition_info, 4))
+            partitions_exported += 1
+        
+        fp.write("\n  ]\n}" if partitions_exported else "]\n}")
+        return partitions_exported
+    
+    def _collect_partition_metadata(self, partition_name: str) -> Dict[str, Any]:
+        """Collect the exported metadata for a single partition."""
+        partition_path = self.config.get_partition_path(partition_name)
+        
+        partition_info = {
+            "name": partition_name,
+            "path": partition_path,
+            "exists": os.path.exists(partition_path)
+        }
+        
+        if partition_info["exists"]:
+            partition_info["size_mb"] = os.path.getsize(partition_path) / (1024 * 1024)
+            partition_info["last_modified"] = datetime.fromtimestamp(os.path.getmtime(partition_path)).isoformat()
+            
+            # Add date range
+            try:
+                start_date, end_date = self.config.get_date_range_for_partition(partition_name)
+                partition_info["date_range"] = {
+                    "start": start_date.isoformat(),
+                    "end": end_date.isoformat()
+                }
+            except Exception as e:
+                partition_info["date_range_error"] = str(e)
+        
+        return partition_info
+    
     async def close(self):
         """Close all connections."""
         await self.partition_manager.close_all_connections()
@@ -12,12 +12,19 @@ from app.domain.entities.data_record import DataRecord
 from app.domain.repositories.data_repository import IDataRepository
 from app.application.dto.data_dto import PaginatedResponse
 from app.application.dto.query_dto import DataQueryRequest, QueryFilter, FilterOperator
-from app.infrastructure.persistence.partitioning.partition_manager import PartitionManager
+from app.infrastructure.persistence.partitioning.partition_manager import PartitionManager, run_on_cursor
 from app.infrastructure.persistence.partitioning.partition_config import PartitionConfig, DEFAULT_PARTITION_CONFIG
 from app.infrastructure.persistence.duckdb.query_builder import DuckDBQueryBuilder
 from app.config.logging_config import logger
 import asyncio
 
+# System columns written ahead of the schema properties in every partition table
+SYSTEM_COLUMNS = ("id", "created_at", "version")
+
+# Filter operators that bound the partition column from below / above during pruning
+LOWER_BOUND_OPERATORS = frozenset({FilterOperator.GTE, FilterOperator.GT})
+UPPER_BOUND_OPERATORS = frozenset({FilterOperator.LTE, FilterOperator.LT})
+
 
 class PartitionedDataRepository(IDataRepository):
     """
@@ -73,13 +80,13 @@ class PartitionedDataRepository(IDataRepository):
                     record.composite_key = schema.get_composite_key_from_data(record.data)
                 
                 # Build insert SQL
-                columns = ["id", "created_at", "version"] + [prop.name for prop in schema.properties]
+                columns = [*SYSTEM_COLUMNS, *schema.property_names]
                 placeholders = ", ".join(["?" for _ in columns])
                 insert_sql = f'INSERT INTO "{schema.table_name}" ({", ".join([f'"{col}"' for col in columns])}) VALUES ({placeholders})'
                 
                 # Prepare values
                 values = [str(record.id), record.created_at.isoformat(), record.version]
-                values.extend([record.data.get(prop.name) for prop in schema.properties])
+                values.extend([record.data.get(name) for name in schema.property_names])
                 
                 conn.execute(insert_sql, values)
                 
@@ -140,7 +147,7 @@ class PartitionedDataRepository(IDataRepository):
                                                   newline='', encoding='utf-8')
             
             # Define columns
-            columns = ["id", "created_at", "version"] + [prop.name for prop in schema.properties]
+            columns = [*SYSTEM_COLUMNS, *schema.property_names]
             
             # Write CSV data
             writer = csv.writer(temp_file, quoting=csv.QUOTE_MINIMAL)
@@ -154,8 +161,8 @@ class PartitionedDataRepository(IDataRepository):
                 row_data = [str(record.id), record.created_at.isoformat(), str(record.version)]
                 
                 # Process schema properties with proper encoding
-                for prop in schema.properties:
-                    value = record.data.get(prop.name, '')
+                for name in schema.property_names:
+                    value = record.data.get(name, '')
                     if value is None:
                         row_data.append('')
                     elif isinstance(value, str):
@@ -219,11 +226,13 @@ class PartitionedDataRepository(IDataRepository):
     def _get_partition_for_data(self, data: Dict[str, Any]) -> str:
         """Determine which partition should contain this data."""
         timestamp_value = data.get(self.config.partition_column)
-        if timestamp_value:
-            return self.partition_manager.get_partition_for_timestamp(str(timestamp_value))
-        else:
+        if not timestamp_value:
             # Fallback to current date if no timestamp
-            return self.partition_manager.get_partition_for_timestamp(datetime.now().isoformat())
+            return self.config.get_partition_for_date(datetime.now())
+        if isinstance(timestamp_value, datetime):
+            # Already a datetime: skip the str() -> parse round trip
+            return self.config.get_partition_for_date(timestamp_value)
+        return self.partition_manager.get_partition_for_timestamp(str(timestamp_value))
     
     def _group_records_by_partition(self, records: List[DataRecord]) -> Dict[str, List[DataRecord]]:
         """Group records by their target partition."""
@@ -288,49 +297,18 @@ class PartitionedDataRepository(IDataRepository):
         
         logger.info(f"[PARTITIONED-REPO] Querying {len(target_partitions)} partitions")
         
-        # For simplicity, query each partition and aggregate results
+        # Query all target partitions concurrently and aggregate results in partition order
         # In production, you might want to implement more sophisticated query planning
+        partition_results = await asyncio.gather(*(
+            self._query_partition_page(schema, partition_name, query_request)
+            for partition_name in target_partitions
+        ))
+        
         all_records = []
         total_count = 0
-        
-        for partition_name in target_partitions:
-            try:
-                if partition_name == "main":
-                    connection_context = self.partition_manager.acquire_main_connection()
-                else:
-                    connection_context = self.partition_manager.acquire_partition_connection(partition_name)
-                
-                async with connection_context as conn:
-                    # Build query
-                    query_builder = DuckDBQueryBuilder(schema)
-                    query_builder.add_filters(query_request.filters)
-                    query_builder.add_sorts(query_request.sort)
-                    
-                    # Get count
-                    count_sql = query_builder.build_count_query()
-                    count_params = query_builder.get_params()
-                    count_result = conn.execute(count_sql, count_params).fetchone()
-                    partition_count = count_result[0] if count_result else 0
-                    total_count += partition_count
-                    
-                    # Get records (simplified - you might want to implement distributed pagination)
-                    if query_request.pagination:
-                        offset = (query_request.pagination.page - 1) * query_request.pagination.size
-                        query_builder.add_pagination(query_request.pagination.size, offset)
-                    
-                    select_sql = query_builder.build_select_query()
-                    select_params = query_builder.get_params()
-                    
-                    result_relation = conn.execute(select_sql, select_params)
-                    rows = result_relation.fetchall()
-                    description = result_relation.description
-                    
-                    partition_records = [self._map_row_to_data_record_optimized(schema, row, description) for row in rows]
-                    all_records.extend(partition_records)
-                    
-            except Exception as e:
-                logger.warning(f"Error querying partition {partition_name}: {e}")
-                continue
+        for partition_count, partition_records in partition_results:
+            total_count += partition_count
+            all_records.extend(partition_records)
         
         # Calculate pagination (simplified)
         current_page = query_request.pagination.page if query_request.pagination else 1
@@ -351,6 +329,51 @@ class PartitionedDataRepository(IDataRepository):
             has_previous=has_previous
         )
     
+    async def _query_partition_page(self, schema: Schema, partition_name: str, query_request: DataQueryRequest) -> tuple[int, List[DataRecord]]:
+        """Count and fetch one page from a single partition; failures yield an empty result."""
+        try:
+            if partition_name == "main":
+                connection_context = self.partition_manager.acquire_main_connection()
+            else:
+                connection_context = self.partition_manager.acquire_partition_connection(partition_name)
+            
+            async with connection_context as conn:
+                # The blocking DuckDB calls run in a worker thread, overlapping across partitions; the
+                # cursor keeps them apart from other requests sharing this partition's connection
+                return await run_on_cursor(conn, self._fetch_partition_page, schema, query_request)
+                
+        except Exception as e:
+            logger.warning(f"Error querying partition {partition_name}: {e}")
+            return 0, []
+    
+    def _fetch_partition_page(self, cursor, schema: Schema, query_request: DataQueryRequest) -> tuple[int, List[DataRecord]]:
+        """Run the count and page queries on a cursor of one partition connection."""
+        # Build query
+        query_builder = DuckDBQueryBuilder(schema)
+        query_builder.add_filters(query_request.filters)
+        query_builder.add_sorts(query_request.sort)
+        
+        # Get count
+        count_sql = query_builder.build_count_query()
+        count_params = query_builder.get_params()
+        count_result = cursor.execute(count_sql, count_params).fetchone()
+        partition_count = count_result[0] if count_result else 0
+        
+        # Get records (simplified - you might want to implement distributed pagination)
+        if query_request.pagination:
+            offset = (query_request.pagination.page - 1) * query_request.pagination.size
+            query_builder.add_pagination(query_request.pagination.size, offset)
+        
+        select_sql = query_builder.build_select_query()
+        select_params = query_builder.get_params()
+        
+        result_relation = cursor.execute(select_sql, select_params)
+        rows = result_relation.fetchall()
+        description = result_relation.description
+        
+        partition_records = [self._map_row_to_data_record_optimized(schema, row, description) for row in rows]
+        return partition_count, partition_records
+    
     def _determine_target_partitions(self, query_request: DataQueryRequest) -> List[str]:
         """Determine which partitions need to be queried based on filters."""
         target_partitions = []
@@ -368,23 +391,19 @@ class PartitionedDataRepository(IDataRepository):
             end_date = None
             
             for date_filter in date_filters:
-                if date_filter.operator in [FilterOperator.GTE, FilterOperator.GT]:
-                    try:
-                        start_date = datetime.fromisoformat(str(date_filter.value).replace('Z', '+00:00'))
-                    except:
-                        pass
-                elif date_filter.operator in [FilterOperator.LTE, FilterOperator.LT]:
-                    try:
-                        end_date = datetime.fromisoformat(str(date_filter.value).replace('Z', '+00:00'))
-                    except:
-                        pass
+                # Parse the filter value once; every operator branch below works from the same datetime
+                try:
+                    filter_date = datetime.fromisoformat(str(date_filter.value).replace('Z', '+00:00'))
+                except ValueError:
+                    continue
+                
+                if date_filter.operator in LOWER_BOUND_OPERATORS:
+                    start_date = filter_date
+                elif date_filter.operator in UPPER_BOUND_OPERATORS:
+                    end_date = filter_date
                 elif date_filter.operator == FilterOperator.EQ:
-                    try:
-                        filter_date = datetime.fromisoformat(str(date_filter.value).replace('Z', '+00:00'))
-                        start_date = filter_date
-                        end_date = filter_date
-                    except:
-                        pass
+                    start_date = filter_date
+                    end_date = filter_date
             
             if start_date or end_date:
                 # Use a reasonable default range if only one bound is specified
@@ -495,9 +514,9 @@ class PartitionedDataRepository(IDataRepository):
         
         # Extract data fields
         data = {}
-        for prop in schema.properties:
-            if prop.name in row_dict:
-                data[prop.name] = row_dict[prop.name]
+        for name in schema.property_names:
+            if name in row_dict:
+                data[name] = row_dict[name]
         
         # Create record
         record = DataRecord(
@@ -2,13 +2,20 @@ from fastapi.responses import Response
 import pyarrow as pa
 import pyarrow.ipc as ipc
 
+# Rows per IPC record batch, so clients can consume the stream one bounded batch at a time
+ARROW_RESPONSE_BATCH_ROWS = 100_000
+
+# Row count of the streamed table, so clients that only need the count can skip decoding the body
+ROW_COUNT_HEADER = "X-Total-Count"
+
 class ArrowResponse(Response):
     media_type = "application/vnd.apache.arrow.stream"
 
     def __init__(self, table: pa.Table, **kwargs):
         sink = pa.BufferOutputStream()
         with ipc.new_stream(sink, table.schema) as writer:
-            writer.write_table(table)
+            writer.write_table(table, max_chunksize=ARROW_RESPONSE_BATCH_ROWS)
         
         content = sink.getvalue().to_pybytes()
-        super().__init__(content=content, media_type=self.media_type, **kwargs) 
\ No newline at end of file
+        super().__init__(content=content, media_type=self.media_type, **kwargs)
+        self.headers[ROW_COUNT_HEADER] = str(table.num_rows) 
\ No newline at end of file
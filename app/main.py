@@ -1,5 +1,6 @@
 # app/main.py
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from app.config.settings import settings
 from app.container.container import container
@@ -20,6 +21,14 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Compress responses for clients that send Accept-Encoding: gzip (opt-in via GZIP_ENABLED)
+if settings.GZIP_ENABLED:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL
+    )
+
 @app.get("/")
 async def read_root():
     """
@@ -57,6 +57,9 @@ def create_sample_well_production_data(count: int = 1000) -> List[DataRecord]:
     """Create sample well production data for testing."""
     records = []
     base_date = datetime(2023, 1, 1)
+    # Repeating strings are formatted once and indexed per record
+    field_names = tuple(f"Field_{n}" for n in range(10))
+    partitions = tuple(f"partition_{n}" for n in range(5))
     
     for i in range(count):
         # Create data that spans multiple partitions
@@ -65,19 +68,19 @@ def create_sample_well_production_data(count: int = 1000) -> List[DataRecord]:
         
         data = {
             "field_code": i % 10,  # 10 different fields
-            "field_name": f"Field_{i % 10}",
+            "field_name": field_names[i % 10],
             "well_code": i,
             "well_reference": f"WELL_{i:06d}",
             "well_name": f"Well {i}",
             "production_period": production_date.isoformat(),
             "days_on_production": 30,
-            "oil_production_kbd": round(100 + (i % 50), 2),
-            "gas_production_mmcfd": round(50 + (i % 25), 2),
-            "liquids_production_kbd": round(120 + (i % 60), 2),
-            "water_production_kbd": round(10 + (i % 20), 2),
+            "oil_production_kbd": 100 + (i % 50),
+            "gas_production_mmcfd": 50 + (i % 25),
+            "liquids_production_kbd": 120 + (i % 60),
+            "water_production_kbd": 10 + (i % 20),
             "data_source": "TEST_DATA",
             "source_data": "EXAMPLE",
-            "partition_0": f"partition_{i % 5}",
+            "partition_0": partitions[i % 5],
         }
         
         records.append(DataRecord.create(data))
@@ -266,7 +269,7 @@ async def example_4_partition_management():
     schema = get_well_production_schema()
     
     # Import partition utilities
-    from app.infrastructure.persistence.partitioning.partition_utilities import PartitionUtilities
+    from app.infrastructure.persistence.partitioning.partition_utilities import PartitionUtilities, format_check_name
     
     utilities = PartitionUtilities(config)
     await utilities.initialize()
@@ -283,7 +286,7 @@ async def example_4_partition_management():
         print("\n🔍 Health checks:")
         for check, passed in health_report['health_checks'].items():
             status = "✅" if passed else "❌"
-            print(f"   {status} {check.replace('_', ' ').title()}")
+            print(f"   {status} {format_check_name(check)}")
         
         if health_report['recommendations']:
             print("\n💡 Recommendations:")
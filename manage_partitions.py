@@ -22,7 +22,7 @@ from datetime import datetime
 from typing import Dict, Any
 
 # Import existing modules
-from app.infrastructure.metadata.schemas_description import SCHEMAS_METADATA
+from app.infrastructure.metadata.schemas_description import SCHEMAS_METADATA_BY_NAME, SCHEMA_NAMES
 from app.domain.entities.schema import Schema
 from app.infrastructure.persistence.duckdb.connection_pool import AsyncDuckDBPool
 from app.config.settings import settings
@@ -34,32 +34,18 @@ from app.infrastructure.persistence.partitioning.partition_config import (
 from app.infrastructure.persistence.partitioning.partition_manager import PartitionManager
 from app.infrastructure.persistence.partitioning.partitioned_data_repository import PartitionedDataRepository
 from app.infrastructure.persistence.partitioning.partition_migrator import PartitionMigrator
-from app.infrastructure.persistence.partitioning.partition_utilities import PartitionUtilities
+from app.infrastructure.persistence.partitioning.partition_utilities import PartitionUtilities, format_check_name
 
 from app.config.logging_config import logger
 
 
 def get_schema_by_name(schema_name: str) -> Schema:
-    """Get a schema object by name from SCHEMAS_METADATA."""
-    for schema_dict in SCHEMAS_METADATA:
-        if schema_dict["name"] == schema_name:
-            return Schema(
-                name=schema_dict["name"],
-                description=schema_dict["description"],
-                table_name=schema_dict["table_name"],
-                primary_key=schema_dict.get("primary_key", []),
-                properties=[
-                    Schema.Property(
-                        name=prop["name"],
-                        type=prop["type"],
-                        db_type=prop["db_type"],
-                        required=prop.get("required", False),
-                        primary_key=prop.get("primary_key", False)
-                    )
-                    for prop in schema_dict["properties"]
-                ]
-            )
-    raise ValueError(f"Schema '{schema_name}' not found")
+    """Get a schema object by name from SCHEMAS_METADATA (a fresh instance per call; the metadata lookup is indexed)."""
+    try:
+        schema_dict = SCHEMAS_METADATA_BY_NAME[schema_name]
+    except KeyError:
+        raise ValueError(f"Schema '{schema_name}' not found") from None
+    return Schema(**schema_dict)
 
 
 async def cmd_analyze_partitions(args):
@@ -196,7 +182,7 @@ async def cmd_health_report(args):
         print("\nHealth Checks:")
         for check, passed in report['health_checks'].items():
             status = "✅ PASS" if passed else "❌ FAIL"
-            print(f"  {status} {check.replace('_', ' ').title()}")
+            print(f"  {status} {format_check_name(check)}")
         
         if report['recommendations']:
             print("\n💡 Recommendations:")
@@ -326,11 +312,23 @@ async def cmd_test_partitioned_repo(args):
         await repo.close()
 
 
+# Subcommand name -> coroutine handler, looked up once instead of walking an if/elif chain
+COMMAND_HANDLERS = {
+    "analyze": cmd_analyze_partitions,
+    "migrate": cmd_migrate_data,
+    "health-report": cmd_health_report,
+    "stats": cmd_partition_stats,
+    "cleanup": cmd_cleanup_partitions,
+    "test": cmd_test_partitioned_repo,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Partition Management Tool")
     
     # Global arguments
     parser.add_argument("--schema", default="well_production", 
+                       choices=SCHEMA_NAMES,
                        help="Schema name to work with (default: well_production)")
     parser.add_argument("--strategy", default="monthly", 
                        choices=["yearly", "monthly", "weekly", "daily"],
@@ -380,18 +378,7 @@ def main():
     logger.info(f"Starting partition management command: {args.command}")
     
     # Execute command
-    if args.command == "analyze":
-        asyncio.run(cmd_analyze_partitions(args))
-    elif args.command == "migrate":
-        asyncio.run(cmd_migrate_data(args))
-    elif args.command == "health-report":
-        asyncio.run(cmd_health_report(args))
-    elif args.command == "stats":
-        asyncio.run(cmd_partition_stats(args))
-    elif args.command == "cleanup":
-        asyncio.run(cmd_cleanup_partitions(args))
-    elif args.command == "test":
-        asyncio.run(cmd_test_partitioned_repo(args))
+    asyncio.run(COMMAND_HANDLERS[args.command](args))
 
 
 if __name__ == "__main__":
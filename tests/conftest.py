@@ -1,29 +1,64 @@
 import pytest
+import pytest_asyncio
+import httpx
 from fastapi.testclient import TestClient
 from app.main import app
 import pyarrow as pa
+import duckdb
 import pandas as pd
 import asyncio
 import factory
 from app.domain.entities.schema import Schema, SchemaProperty
 import os
-import json
+import orjson
+import functools
 
 @pytest.fixture(scope="session")
 def client():
     return TestClient(app)
 
+@pytest_asyncio.fixture
+async def async_client():
+    # Requests are dispatched to the ASGI app in-loop, without TestClient's thread portal
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def duckdb_conn():
+    # One in-memory connection per session; the arrow extension is installed/loaded once
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.execute("INSTALL arrow; LOAD arrow")
+    except Exception:
+        pass
+    yield conn
+    conn.close()
+
+@pytest.fixture(params=["memory", "file"])
+def duckdb_db(request, tmp_path):
+    # In-memory where persistence doesn't matter; file-backed databases live under tmp_path,
+    # which pytest cleans up itself
+    if request.param == "memory":
+        return ":memory:"
+    return str(tmp_path / "test.duckdb")
+
+@pytest.fixture(scope="session")
 def sample_arrow_table():
+    # Arrow tables are immutable, so one instance is safe to share
     df = pd.DataFrame({"id": ["a", "b"], "value": [1, 2]})
     return pa.Table.from_pandas(df)
 
+@pytest.fixture(scope="session")
+def sample_schema():
+    # Shared read-only schema; a test that needs to mutate it should take a model_copy(deep=True)
+    return Schema(name="s", description="d", table_name="t", properties=[], primary_key=None)
+
 class SchemaPropertyFactory(factory.Factory):
     class Meta:
         model = SchemaProperty
@@ -47,17 +82,20 @@ class SchemaFactory(factory.Factory):
 def schema_factory():
     return SchemaFactory
 
-@pytest.fixture
-def test_data():
+@functools.lru_cache(maxsize=1)
+def _load_test_data_files():
+    # Read the JSON fixtures once per session; each test decodes its own fresh copy with
+    # orjson, which is cheaper than deep-copying an already parsed structure
     data_dir = os.path.join(os.path.dirname(__file__), "data")
+    loaded = []
     if os.path.exists(data_dir):
         for fname in os.listdir(data_dir):
             if fname.endswith(".json"):
-                with open(os.path.join(data_dir, fname)) as f:
-                    yield json.load(f)
-
-@pytest.mark.slow
-def test_slow_example():
-    import time
-    time.sleep(0.1)
-    assert True 
\ No newline at end of file
+                with open(os.path.join(data_dir, fname), "rb") as f:
+                    loaded.append(f.read())
+    return tuple(loaded)
+
+@pytest.fixture
+def test_data():
+    for raw in _load_test_data_files():
+        yield orjson.loads(raw) 
\ No newline at end of file
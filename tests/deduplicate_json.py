@@ -11,7 +11,7 @@ This script reads a JSON file with the structure:
 It removes duplicates based on key fields and saves the cleaned data.
 """
 
-import json
+import orjson
 import polars as pl
 from pathlib import Path
 import sys
@@ -21,12 +21,12 @@ import time
 def load_json_data(file_path: Path) -> dict:
     """Load JSON data from file."""
     print(f"Loading data from {file_path}...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
     
-    load_time = time.time() - start_time
+    load_time = time.perf_counter() - start_time
     print(f"✓ Data loaded in {load_time:.2f} seconds")
     return data
 
@@ -34,7 +34,7 @@ def load_json_data(file_path: Path) -> dict:
 def deduplicate_data(data: dict) -> dict:
     """Remove duplicates from the data using Polars."""
     print("Starting deduplication process...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Extract the records array
     records = data.get('value', [])
@@ -89,7 +89,7 @@ def deduplicate_data(data: dict) -> dict:
     dedup_data = data.copy()
     dedup_data['value'] = dedup_records
     
-    dedup_time = time.time() - start_time
+    dedup_time = time.perf_counter() - start_time
     print(f"✓ Deduplication completed in {dedup_time:.2f} seconds")
     
     return dedup_data
@@ -98,12 +98,12 @@ def deduplicate_data(data: dict) -> dict:
 def save_json_data(data: dict, file_path: Path):
     """Save data to JSON file."""
     print(f"Saving deduplicated data to {file_path}...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
-    save_time = time.time() - start_time
+    save_time = time.perf_counter() - start_time
     print(f"✓ Data saved in {save_time:.2f} seconds")
 
 
@@ -10,12 +10,15 @@ This script creates a test file with:
 - Expected duplicates detected: 5,001 (5,000 + 1 extra)
 """
 
-import json
+import orjson
 import random
-import copy
 from pathlib import Path
 from datetime import datetime, timedelta
 import sys
+import pyarrow as pa
+import pyarrow.compute as pc
+
+COMPOSITE_KEY_COLUMNS = ["field_code", "well_code", "production_period"]
 
 
 def load_original_data(file_path: Path) -> dict:
@@ -26,8 +29,8 @@ def load_original_data(file_path: Path) -> dict:
         print(f"Error: Original file {file_path} not found!")
         sys.exit(1)
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
     
     original_records = data.get('value', [])
     print(f"✓ Loaded {len(original_records)} original records")
@@ -39,8 +42,8 @@ def generate_variations(base_record: dict, variations_count: int) -> list:
     variations = []
     
     for i in range(variations_count):
-        # Create a copy of the base record
-        variation = copy.deepcopy(base_record)
+        # Shallow copy is enough: only top-level keys are reassigned below
+        variation = dict(base_record)
         
         # Modify key fields to make it unique
         variation['field_code'] = random.randint(1, 10000)  # Increased range to avoid collisions
@@ -77,12 +80,13 @@ def create_exact_duplicates(unique_records: list) -> tuple:
     """Create exactly one duplicate for each unique record, plus one extra duplicate."""
     # Create one duplicate for each unique record
     duplicates = []
+    # Duplicates are never modified, so shallow copies suffice
     for record in unique_records:
-        duplicate = copy.deepcopy(record)
+        duplicate = dict(record)
         duplicates.append(duplicate)
     
     # Create one additional duplicate of the first record (making it appear 3 times total)
-    extra_duplicate = copy.deepcopy(unique_records[0])
+    extra_duplicate = dict(unique_records[0])
     duplicates.append(extra_duplicate)
     
     return duplicates, unique_records[0]  # Return the record that appears 3 times
@@ -150,17 +154,23 @@ def main():
     
     print(f"✓ Total records created: {len(all_records):,}")
     
-    # Verify the counts
-    from collections import defaultdict
-    composite_keys = defaultdict(int)
-    for record in all_records:
-        key = (record['field_code'], record['well_code'], record['production_period'])
-        composite_keys[key] += 1
-    
-    unique_count = len(composite_keys)
-    records_appearing_twice = sum(1 for count in composite_keys.values() if count == 2)
-    records_appearing_thrice = sum(1 for count in composite_keys.values() if count == 3)
-    total_duplicates = sum(count - 1 for count in composite_keys.values())
+    # Verify the counts: group the composite key columns in Arrow, as verify_duplicates.py does,
+    # instead of hashing a Python tuple per record
+    keys_table = pa.table({
+        column: [record[column] for record in all_records]
+        for column in COMPOSITE_KEY_COLUMNS
+    })
+    key_counts = keys_table.group_by(COMPOSITE_KEY_COLUMNS, use_threads=False).aggregate([([], "count_all")])
+    
+    unique_count = key_counts.num_rows
+    # Histogram of occurrences per key gathers every figure reported below
+    occurrences = {
+        entry["values"]: entry["counts"]
+        for entry in pc.value_counts(key_counts["count_all"]).to_pylist()
+    }
+    records_appearing_twice = occurrences.get(2, 0)
+    records_appearing_thrice = occurrences.get(3, 0)
+    total_duplicates = len(all_records) - unique_count
     
     print(f"\nVerification:")
     print(f"✓ Unique composite keys: {unique_count:,}")
@@ -168,14 +178,13 @@ def main():
     print(f"✓ Records appearing exactly 3 times: {records_appearing_thrice:,}")
     print(f"✓ Total duplicates that will be detected: {total_duplicates:,}")
     
-    # Create output data structure
-    output_data = copy.deepcopy(original_data)
-    output_data['value'] = all_records
+    # Create output data structure (the original 'value' list is replaced, so no deep copy)
+    output_data = {**original_data, 'value': all_records}
     
     # Save to file
     print(f"\nSaving data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
     
     # Calculate file size
     file_size_mb = output_file.stat().st_size / (1024 * 1024)
@@ -1,6 +1,9 @@
 import duckdb
 import pandas as pd
-import json
+import numpy as np
+import orjson
+import io
+import sys
 import time
 import tempfile
 import os
@@ -21,8 +24,19 @@ DUCKDB_FILE_SUFFIX = ".duckdb"
 # Number of test records to generate (set to 0 to use file)
 TEST_DATA_SIZE = 900_000  # Set to 0 to use file, >0 to use generated data
 
+# Per-benchmark timing detail is printed only with BENCH_VERBOSE=1
+VERBOSE = os.environ.get("BENCH_VERBOSE") == "1"
+
 # --- END CONFIGURABLE PARAMETERS ---
 
+# --- Result table layout (static, shared by every table print) ---
+RESULT_TABLE_KEYS = ("Bulk insert (s)", "Bulk read (s)", "Total time (s)")
+RESULT_TABLE_HEADER = ("Benchmark", *RESULT_TABLE_KEYS)
+INSERT_TABLE_KEYS = ("Bulk insert (s)", "Insert CPU time (s)", "Insert RAM used (MB)")
+INSERT_TABLE_HEADER = ("Benchmark", *INSERT_TABLE_KEYS)
+READ_TABLE_KEYS = ("Bulk read (s)", "Read CPU time (s)", "Read RAM used (MB)")
+READ_TABLE_HEADER = ("Benchmark", *READ_TABLE_KEYS)
+
 # --- Load schema from schemas_description.py ---
 from app.infrastructure.metadata.schemas_description import SCHEMAS_METADATA
 
@@ -63,68 +77,50 @@ def make_ddl(schema):
 table_ddl = make_ddl(schema)
 
 
-def test_data() -> List[Dict[str, Any]]:
-    """Generate test data with unique composite primary keys, supporting fast repetition with offset."""
-    data = []
-    from datetime import datetime, timedelta
-    base_date = datetime(2024, 1, 1)
-    # Generate a base chunk of unique records
+def test_data() -> pd.DataFrame:
+    """Generate test data with unique composite primary keys as NumPy columns (no per-record dicts)."""
+    # Row k maps onto base-chunk row i = k % CHUNK_SIZE; production_period advances one second per row
     CHUNK_SIZE = 1_000_000
-    chunk = []
-    for i in range(CHUNK_SIZE):
-        prod_date = base_date + timedelta(seconds=i)
-        record = {
-            "field_code": i % 1000,
-            "_field_name": f"Field_{i % 1000}",
-            "well_code": i % 100,
-            "_well_reference": f"WELL_REF_{i % 100:03d}",
-            "well_name": f"Well_{i % 100}",
-            "production_period": prod_date.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-            "days_on_production": 30,
-            "oil_production_kbd": round(100.0 + (i * 0.1), 2),
-            "gas_production_mmcfd": round(50.0 + (i * 0.05), 2),
-            "liquids_production_kbd": round(25.0 + (i * 0.025), 2),
-            "water_production_kbd": round(75.0 + (i * 0.075), 2),
-            "data_source": "performance_test",
-            "source_data": json.dumps({"test": f"data_{i}"}),
-            "partition_0": f"partition_{i % 10}"
-        }
-        chunk.append(record)
-    # Repeat the chunk, offsetting production_period for each repetition
-    for rep in range(TEST_DATA_SIZE // CHUNK_SIZE):
-        offset = rep * CHUNK_SIZE
-        for rec in chunk:
-            rec_copy = rec.copy()
-            # Offset production_period by CHUNK_SIZE seconds per repetition
-            from datetime import datetime
-            prod_dt = datetime.strptime(rec_copy["production_period"], "%Y-%m-%dT%H:%M:%S+00:00")
-            prod_dt = prod_dt + timedelta(seconds=offset)
-            rec_copy["production_period"] = prod_dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            data.append(rec_copy)
-    # Add any remaining records if TEST_DATA_SIZE is not a multiple of CHUNK_SIZE
-    remainder = TEST_DATA_SIZE % CHUNK_SIZE
-    if remainder:
-        offset = (TEST_DATA_SIZE // CHUNK_SIZE) * CHUNK_SIZE
-        for i in range(remainder):
-            rec = chunk[i].copy()
-            prod_dt = datetime.strptime(rec["production_period"], "%Y-%m-%dT%H:%M:%S+00:00")
-            prod_dt = prod_dt + timedelta(seconds=offset)
-            rec["production_period"] = prod_dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            data.append(rec)
-    return data
+    k = np.arange(TEST_DATA_SIZE, dtype=np.int64)
+    i = k % CHUNK_SIZE
+    field_codes = i % 1000
+    well_codes = i % 100
+    # Repeating string columns are built once per unique value and gathered by index
+    field_names = np.array([f"Field_{n}" for n in range(1000)], dtype=object)
+    well_refs = np.array([f"WELL_REF_{n:03d}" for n in range(100)], dtype=object)
+    well_names = np.array([f"Well_{n}" for n in range(100)], dtype=object)
+    partitions = np.array([f"partition_{n}" for n in range(10)], dtype=object)
+    # Same text as json.dumps({"test": f"data_{n}"}), assembled column-wise
+    source_datas = np.char.add(np.char.add('{"test": "data_', np.arange(min(TEST_DATA_SIZE, CHUNK_SIZE)).astype(str)), '"}').astype(object)
+    periods = np.datetime64("2024-01-01T00:00:00", "s") + k.astype("timedelta64[s]")
+    return pd.DataFrame({
+        "field_code": field_codes,
+        "_field_name": field_names[field_codes],
+        "well_code": well_codes,
+        "_well_reference": well_refs[well_codes],
+        "well_name": well_names[well_codes],
+        "production_period": np.char.add(np.datetime_as_string(periods, unit="s"), "+00:00"),
+        "days_on_production": np.full(TEST_DATA_SIZE, 30, dtype=np.int64),
+        "oil_production_kbd": np.round(100.0 + i * 0.1, 2),
+        "gas_production_mmcfd": np.round(50.0 + i * 0.05, 2),
+        "liquids_production_kbd": np.round(25.0 + i * 0.025, 2),
+        "water_production_kbd": np.round(75.0 + i * 0.075, 2),
+        "data_source": "performance_test",
+        "source_data": source_datas[i],
+        "partition_0": partitions[i % 10],
+    })
 
 # --- Load data from mocked_response.json or generate test data ---
 def get_benchmark_dataset():
     if TEST_DATA_SIZE > 0:
         print(f"Generating {TEST_DATA_SIZE} test records...")
         start_df = time.time()
-        records = test_data()
-        df = pd.DataFrame(records)
+        df = test_data()
         end_df = time.time()
     else:
         data_path = Path(MOCKED_JSON_PATH)
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(data_path, "rb") as f:
+            data = orjson.loads(f.read())
         # Use the list under the 'value' key
         records = data["value"]
         start_df = time.time()
@@ -134,9 +130,6 @@ def get_benchmark_dataset():
 
 
 def print_results_table(results):
-    # Only show selected columns
-    selected_keys = ["Bulk insert (s)", "Bulk read (s)", "Total time (s)"]
-    header = ["Benchmark"] + selected_keys
     rows = []
     for bench_name, bench_results in results.items():
         row = [bench_name]
@@ -147,7 +140,7 @@ def print_results_table(results):
             total_time = bulk_insert + bulk_read
         else:
             total_time = "-"
-        for key in selected_keys:
+        for key in RESULT_TABLE_KEYS:
             if key == "Total time (s)":
                 val = total_time
             else:
@@ -158,73 +151,69 @@ def print_results_table(results):
         rows.append(row)
 
     # Calculate column widths
-    col_widths = [max(len(str(cell)) for cell in col) for col in zip(header, *rows)]
-
-    # Print header
-    def print_row(row):
-        print("| " + " | ".join(cell.ljust(width) for cell, width in zip(row, col_widths)) + " |")
-
-    print("\nBenchmark Results:")
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
-    print_row(header)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
+    col_widths = [max(len(str(cell)) for cell in col) for col in zip(RESULT_TABLE_HEADER, *rows)]
+
+    # Build the whole table in one buffer and write it to stdout once
+    out = io.StringIO()
+    separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+\n"
+    # The column widths fix the row layout, so it is compiled into one format template up front
+    row_template = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |\n"
+
+    out.write("\nBenchmark Results:\n")
+    out.write(separator)
+    out.write(row_template.format(*RESULT_TABLE_HEADER))
+    out.write(separator)
     for row in rows:
-        print_row(row)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
+        out.write(row_template.format(*row))
+    out.write(separator)
+    sys.stdout.write(out.getvalue())
 
 
 def print_memory_cpu_tables(results):
     # Table 1: Insert phase
-    insert_keys = [
-        "Bulk insert (s)",
-        "Insert CPU time (s)",
-        "Insert RAM used (MB)"
-    ]
-    header_insert = ["Benchmark"] + insert_keys
     rows_insert = []
     for bench_name, bench_results in results.items():
         row = [bench_name]
-        for key in insert_keys:
+        for key in INSERT_TABLE_KEYS:
             val = bench_results.get(key, "-")
             if isinstance(val, float):
                 val = f"{val:.4f}"
             row.append(str(val))
         rows_insert.append(row)
-    col_widths_insert = [max(len(str(cell)) for cell in col) for col in zip(header_insert, *rows_insert)]
-    def print_row(row, col_widths):
-        print("| " + " | ".join(cell.ljust(width) for cell, width in zip(row, col_widths)) + " |")
-    print("\nInsert Phase Resource Usage:")
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_insert) + "+")
-    print_row(header_insert, col_widths_insert)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_insert) + "+")
+    col_widths_insert = [max(len(str(cell)) for cell in col) for col in zip(INSERT_TABLE_HEADER, *rows_insert)]
+    # Both tables go into one buffer that is written to stdout once
+    out = io.StringIO()
+    separator_insert = "+" + "+".join("-" * (w + 2) for w in col_widths_insert) + "+\n"
+    row_template_insert = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths_insert) + " |\n"
+    out.write("\nInsert Phase Resource Usage:\n")
+    out.write(separator_insert)
+    out.write(row_template_insert.format(*INSERT_TABLE_HEADER))
+    out.write(separator_insert)
     for row in rows_insert:
-        print_row(row, col_widths_insert)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_insert) + "+")
+        out.write(row_template_insert.format(*row))
+    out.write(separator_insert)
 
     # Table 2: Read phase
-    read_keys = [
-        "Bulk read (s)",
-        "Read CPU time (s)",
-        "Read RAM used (MB)"
-    ]
-    header_read = ["Benchmark"] + read_keys
     rows_read = []
     for bench_name, bench_results in results.items():
         row = [bench_name]
-        for key in read_keys:
+        for key in READ_TABLE_KEYS:
             val = bench_results.get(key, "-")
             if isinstance(val, float):
                 val = f"{val:.4f}"
             row.append(str(val))
         rows_read.append(row)
-    col_widths_read = [max(len(str(cell)) for cell in col) for col in zip(header_read, *rows_read)]
-    print("\nRead Phase Resource Usage:")
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_read) + "+")
-    print_row(header_read, col_widths_read)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_read) + "+")
+    col_widths_read = [max(len(str(cell)) for cell in col) for col in zip(READ_TABLE_HEADER, *rows_read)]
+    separator_read = "+" + "+".join("-" * (w + 2) for w in col_widths_read) + "+\n"
+    row_template_read = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths_read) + " |\n"
+    out.write("\nRead Phase Resource Usage:\n")
+    out.write(separator_read)
+    out.write(row_template_read.format(*READ_TABLE_HEADER))
+    out.write(separator_read)
     for row in rows_read:
-        print_row(row, col_widths_read)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths_read) + "+")
+        out.write(row_template_read.format(*row))
+    out.write(separator_read)
+    sys.stdout.write(out.getvalue())
 
 
 def monitor_resource_usage(func):
@@ -288,13 +277,14 @@ def e2e_bench_1(shared_df, start_df, end_df):
     read_mem = mem_after_read - mem_before_read
 
     # --- Print timings ---
-    print("[e2e_bench_1]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_1]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -358,13 +348,14 @@ def e2e_bench_3(shared_df, start_df, end_df):
     read_mem = mem_after_read - mem_before_read
 
     # --- Print timings ---
-    print("[e2e_bench_4]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_4]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
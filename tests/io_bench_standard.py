@@ -1,6 +1,9 @@
 import duckdb
 import pandas as pd
-import json
+import numpy as np
+import orjson
+import io
+import sys
 import time
 import tempfile
 import os
@@ -20,8 +23,15 @@ DUCKDB_FILE_SUFFIX = ".duckdb"
 # Number of test records to generate (set to 0 to use file)
 TEST_DATA_SIZE = 600000  # Set to 0 to use file, >0 to use generated data
 
+# Per-benchmark timing detail is printed only with BENCH_VERBOSE=1
+VERBOSE = os.environ.get("BENCH_VERBOSE") == "1"
+
 # --- END CONFIGURABLE PARAMETERS ---
 
+# --- Result table layout (static, shared by every table print) ---
+RESULT_TABLE_KEYS = ("Bulk insert (s)", "Bulk read (s)", "Total time (s)")
+RESULT_TABLE_HEADER = ("Benchmark", *RESULT_TABLE_KEYS)
+
 # --- Load schema from schemas_description.py ---
 from app.infrastructure.metadata.schemas_description import SCHEMAS_METADATA
 
@@ -62,68 +72,50 @@ def make_ddl(schema):
 table_ddl = make_ddl(schema)
 
 
-def test_data() -> List[Dict[str, Any]]:
-    """Generate test data with unique composite primary keys, supporting fast repetition with offset."""
-    data = []
-    from datetime import datetime, timedelta
-    base_date = datetime(2024, 1, 1)
-    # Generate a base chunk of unique records
+def test_data() -> pd.DataFrame:
+    """Generate test data with unique composite primary keys as NumPy columns (no per-record dicts)."""
+    # Row k maps onto base-chunk row i = k % CHUNK_SIZE; production_period advances one second per row
     CHUNK_SIZE = 1_000_000
-    chunk = []
-    for i in range(CHUNK_SIZE):
-        prod_date = base_date + timedelta(seconds=i)
-        record = {
-            "field_code": i % 1000,
-            "_field_name": f"Field_{i % 1000}",
-            "well_code": i % 100,
-            "_well_reference": f"WELL_REF_{i % 100:03d}",
-            "well_name": f"Well_{i % 100}",
-            "production_period": prod_date.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-            "days_on_production": 30,
-            "oil_production_kbd": round(100.0 + (i * 0.1), 2),
-            "gas_production_mmcfd": round(50.0 + (i * 0.05), 2),
-            "liquids_production_kbd": round(25.0 + (i * 0.025), 2),
-            "water_production_kbd": round(75.0 + (i * 0.075), 2),
-            "data_source": "performance_test",
-            "source_data": json.dumps({"test": f"data_{i}"}),
-            "partition_0": f"partition_{i % 10}"
-        }
-        chunk.append(record)
-    # Repeat the chunk, offsetting production_period for each repetition
-    for rep in range(TEST_DATA_SIZE // CHUNK_SIZE):
-        offset = rep * CHUNK_SIZE
-        for rec in chunk:
-            rec_copy = rec.copy()
-            # Offset production_period by CHUNK_SIZE seconds per repetition
-            from datetime import datetime
-            prod_dt = datetime.strptime(rec_copy["production_period"], "%Y-%m-%dT%H:%M:%S+00:00")
-            prod_dt = prod_dt + timedelta(seconds=offset)
-            rec_copy["production_period"] = prod_dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            data.append(rec_copy)
-    # Add any remaining records if TEST_DATA_SIZE is not a multiple of CHUNK_SIZE
-    remainder = TEST_DATA_SIZE % CHUNK_SIZE
-    if remainder:
-        offset = (TEST_DATA_SIZE // CHUNK_SIZE) * CHUNK_SIZE
-        for i in range(remainder):
-            rec = chunk[i].copy()
-            prod_dt = datetime.strptime(rec["production_period"], "%Y-%m-%dT%H:%M:%S+00:00")
-            prod_dt = prod_dt + timedelta(seconds=offset)
-            rec["production_period"] = prod_dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            data.append(rec)
-    return data
+    k = np.arange(TEST_DATA_SIZE, dtype=np.int64)
+    i = k % CHUNK_SIZE
+    field_codes = i % 1000
+    well_codes = i % 100
+    # Repeating string columns are built once per unique value and gathered by index
+    field_names = np.array([f"Field_{n}" for n in range(1000)], dtype=object)
+    well_refs = np.array([f"WELL_REF_{n:03d}" for n in range(100)], dtype=object)
+    well_names = np.array([f"Well_{n}" for n in range(100)], dtype=object)
+    partitions = np.array([f"partition_{n}" for n in range(10)], dtype=object)
+    # Same text as json.dumps({"test": f"data_{n}"}), assembled column-wise
+    source_datas = np.char.add(np.char.add('{"test": "data_', np.arange(min(TEST_DATA_SIZE, CHUNK_SIZE)).astype(str)), '"}').astype(object)
+    periods = np.datetime64("2024-01-01T00:00:00", "s") + k.astype("timedelta64[s]")
+    return pd.DataFrame({
+        "field_code": field_codes,
+        "_field_name": field_names[field_codes],
+        "well_code": well_codes,
+        "_well_reference": well_refs[well_codes],
+        "well_name": well_names[well_codes],
+        "production_period": np.char.add(np.datetime_as_string(periods, unit="s"), "+00:00"),
+        "days_on_production": np.full(TEST_DATA_SIZE, 30, dtype=np.int64),
+        "oil_production_kbd": np.round(100.0 + i * 0.1, 2),
+        "gas_production_mmcfd": np.round(50.0 + i * 0.05, 2),
+        "liquids_production_kbd": np.round(25.0 + i * 0.025, 2),
+        "water_production_kbd": np.round(75.0 + i * 0.075, 2),
+        "data_source": "performance_test",
+        "source_data": source_datas[i],
+        "partition_0": partitions[i % 10],
+    })
 
 # --- Load data from mocked_response.json or generate test data ---
 def get_benchmark_dataset():
     if TEST_DATA_SIZE > 0:
         print(f"Generating {TEST_DATA_SIZE} test records...")
         start_df = time.time()
-        records = test_data()
-        df = pd.DataFrame(records)
+        df = test_data()
         end_df = time.time()
     else:
         data_path = Path(MOCKED_JSON_PATH)
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(data_path, "rb") as f:
+            data = orjson.loads(f.read())
         # Use the list under the 'value' key
         records = data["value"]
         start_df = time.time()
@@ -133,9 +125,6 @@ def get_benchmark_dataset():
 
 
 def print_results_table(results):
-    # Only show selected columns
-    selected_keys = ["Bulk insert (s)", "Bulk read (s)", "Total time (s)"]
-    header = ["Benchmark"] + selected_keys
     rows = []
     for bench_name, bench_results in results.items():
         row = [bench_name]
@@ -146,7 +135,7 @@ def print_results_table(results):
             total_time = bulk_insert + bulk_read
         else:
             total_time = "-"
-        for key in selected_keys:
+        for key in RESULT_TABLE_KEYS:
             if key == "Total time (s)":
                 val = total_time
             else:
@@ -157,19 +146,22 @@ def print_results_table(results):
         rows.append(row)
 
     # Calculate column widths
-    col_widths = [max(len(str(cell)) for cell in col) for col in zip(header, *rows)]
-
-    # Print header
-    def print_row(row):
-        print("| " + " | ".join(cell.ljust(width) for cell, width in zip(row, col_widths)) + " |")
-
-    print("\nBenchmark Results:")
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
-    print_row(header)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
+    col_widths = [max(len(str(cell)) for cell in col) for col in zip(RESULT_TABLE_HEADER, *rows)]
+
+    # Build the whole table in one buffer and write it to stdout once
+    out = io.StringIO()
+    separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+\n"
+    # The column widths fix the row layout, so it is compiled into one format template up front
+    row_template = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |\n"
+
+    out.write("\nBenchmark Results:\n")
+    out.write(separator)
+    out.write(row_template.format(*RESULT_TABLE_HEADER))
+    out.write(separator)
     for row in rows:
-        print_row(row)
-    print("+" + "+".join("-" * (w + 2) for w in col_widths) + "+")
+        out.write(row_template.format(*row))
+    out.write(separator)
+    sys.stdout.write(out.getvalue())
 
 
 def e2e_bench_0(shared_df, start_df, end_df):
@@ -198,12 +190,13 @@ def e2e_bench_0(shared_df, start_df, end_df):
     end_read = time.time()
 
     # --- Print timings ---
-    print("[e2e_bench_0]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert: {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_0]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert: {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -251,13 +244,14 @@ def e2e_bench_1(shared_df, start_df, end_df):
     end_read = time.time()
 
     # --- Print timings ---
-    print("[e2e_bench_1]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_1]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -305,13 +299,14 @@ def e2e_bench_3(shared_df, start_df, end_df):
     end_read = time.time()
 
     # --- Print timings ---
-    print("[e2e_bench_3]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Polars Table conversion: {end_polars - start_polars:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (Polars): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_3]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Polars Table conversion: {end_polars - start_polars:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (Polars): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -359,13 +354,14 @@ def e2e_bench_4(shared_df, start_df, end_df):
     end_read = time.time()
 
     # --- Print timings ---
-    print("[e2e_bench_4]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_4]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Arrow Table conversion: {end_arrow - start_arrow:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (Arrow): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -431,14 +427,15 @@ def e2e_bench_4_ultra(shared_df, start_df, end_df):
     end_read = time.time()
 
     # --- Print timings ---
-    print("[e2e_bench_4_ultra]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Parquet write: {end_parquet - start_parquet:.4f} seconds")
-    print(f"Arrow streaming setup: {end_stream - start_stream:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (stream): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
+    if VERBOSE:
+        print("[e2e_bench_4_ultra]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Parquet write: {end_parquet - start_parquet:.4f} seconds")
+        print(f"Arrow streaming setup: {end_stream - start_stream:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (stream): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -499,13 +496,15 @@ def e2e_bench_5_parquet_native(shared_df, start_df, end_df):
     df_out = con.execute(f"SELECT * FROM {DUCKDB_TABLE_NAME};").fetchdf()
     end_read = time.time()
 
-    print("[e2e_bench_5_parquet_native]")
-    print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
-    print(f"Parquet write: {end_parquet - start_parquet:.4f} seconds")
-    print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
-    print(f"Bulk insert (parquet_scan): {end_insert - start_insert:.4f} seconds")
-    print(f"Bulk read: {end_read - start_read:.4f} seconds")
-    print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
+    # --- Print timings ---
+    if VERBOSE:
+        print("[e2e_bench_5_parquet_native]")
+        print(f"DataFrame creation: {end_df - start_df:.4f} seconds")
+        print(f"Parquet write: {end_parquet - start_parquet:.4f} seconds")
+        print(f"DuckDB table creation: {end_create - start_create:.4f} seconds")
+        print(f"Bulk insert (parquet_scan): {end_insert - start_insert:.4f} seconds")
+        print(f"Bulk read: {end_read - start_read:.4f} seconds")
+        print(f"Rows written: {len(shared_df)} | Rows read: {len(df_out)}")
 
     results = {
         "DataFrame creation (s)": end_df - start_df,
@@ -1,56 +1,155 @@
+import io
+import os
+import sys
 import time
-import json
-from typing import List, Dict, Any
-import requests
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+import orjson
+from typing import List, Dict, Any, Optional
+import urllib3
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+# --- CONFIGURABLE PARAMETERS ---
+BASE_URL = "http://localhost:8080"
+SCHEMA_NAME = "well_production"
+
+# Endpoint URLs are built once instead of per request
+ARROW_BULK_URL = f"{BASE_URL}/api/v1/arrow/bulk-insert/{SCHEMA_NAME}"
+TRADITIONAL_BULK_URL = f"{BASE_URL}/api/v1/records/bulk"
+ARROW_READ_URL = f"{BASE_URL}/api/v1/arrow/bulk-read/{SCHEMA_NAME}"
+ROOT_URL = f"{BASE_URL}/"
+# Response header carrying the bulk-read row count
+ROW_COUNT_HEADER = "X-Total-Count"
+# Reads ask for a gzip-compressed body; urllib3 decompresses it transparently
+READ_HEADERS = {"Accept-Encoding": "gzip"}
+
+# Timings are taken with perf_counter_ns and converted once for reporting
+NS_PER_MS = 1_000_000
+NS_PER_SECOND = 1_000_000_000
+
+# Read buffer for streamed Arrow responses; 1 MiB gulps keep the number of Python-level
+# reads through urllib3 low relative to the multi-megabyte record batches
+STREAM_READ_BUFFER_BYTES = 1 << 20
+
+# One keep-alive connection pool for every request; urllib3 directly, without the requests layers
+HTTP = urllib3.PoolManager(num_pools=2, maxsize=8)
+
+# Sentinel for "key absent", so fallback keys are only looked up when the primary key is missing
+_MISSING = object()
+
+
+@lru_cache(maxsize=4)
+def _load_normalized_records(file_path: str, mtime: float) -> List[Dict[str, Any]]:
+    """Decode and normalize a fixture file; cached per (path, mtime) so an edited file is re-read"""
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
+
+    # Extract records from the 'value' array
+    records = data.get('value', [])
+
+    # Normalize field names to match our schema, replacing each decoded record in place
+    # so only one copy of the data set is alive at a time
+    for index, record in enumerate(records):
+        field_name = record.get("_field_name", _MISSING)
+        if field_name is _MISSING:
+            field_name = record.get("field_name", "")
+        well_reference = record.get("_well_reference", _MISSING)
+        if well_reference is _MISSING:
+            well_reference = record.get("well_reference", "")
+        records[index] = {
+            "field_code": record.get("field_code"),
+            "field_name": field_name,
+            "well_code": record.get("well_code"),
+            "well_reference": well_reference,
+            "well_name": record.get("well_name", ""),
+            "production_period": record.get("production_period", ""),
+            "days_on_production": record.get("days_on_production", 0),
+            "oil_production_kbd": record.get("oil_production_kbd", 0.0),
+            "gas_production_mmcfd": record.get("gas_production_mmcfd", 0.0),
+            "liquids_production_kbd": record.get("liquids_production_kbd", 0.0),
+            "water_production_kbd": record.get("water_production_kbd", 0.0),
+            "data_source": record.get("data_source", ""),
+            "source_data": record.get("source_data", ""),
+            "partition_0": record.get("partition_0", "latest")
+        }
+
+    return records
 
 
 def load_json_test_data(file_path: str = "external/mocked_response_100K-4.json") -> List[Dict[str, Any]]:
     """Load test data from JSON file and normalize field names"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract records from the 'value' array
-        records = data.get('value', [])
-        
-        # Normalize field names to match our schema
-        normalized_records = []
-        for record in records:
-            normalized_record = {
-                "field_code": record.get("field_code"),
-                "field_name": record.get("_field_name", record.get("field_name", "")),
-                "well_code": record.get("well_code"),
-                "well_reference": record.get("_well_reference", record.get("well_reference", "")),
-                "well_name": record.get("well_name", ""),
-                "production_period": record.get("production_period", ""),
-                "days_on_production": record.get("days_on_production", 0),
-                "oil_production_kbd": record.get("oil_production_kbd", 0.0),
-                "gas_production_mmcfd": record.get("gas_production_mmcfd", 0.0),
-                "liquids_production_kbd": record.get("liquids_production_kbd", 0.0),
-                "water_production_kbd": record.get("water_production_kbd", 0.0),
-                "data_source": record.get("data_source", ""),
-                "source_data": record.get("source_data", ""),
-                "partition_0": record.get("partition_0", "latest")
-            }
-            normalized_records.append(normalized_record)
-        
-        print(f"✅ Loaded {len(normalized_records):,} records from {file_path}")
-        return normalized_records
+        records = _load_normalized_records(file_path, os.path.getmtime(file_path))
+        print(f"✅ Loaded {len(records):,} records from {file_path}")
+        return records
         
     except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
         return []
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ JSON decode error: {e}")
         return []
     except Exception as e:
         print(f"❌ Error loading JSON data: {e}")
         return []
 
-def run_load_data_fast():
+def records_to_arrow_ipc(records: List[Dict[str, Any]]) -> bytes:
+    """Serialize normalized records as an Arrow IPC stream, prepending the table's system columns"""
+    table = pa.Table.from_pylist(records)
+    num_rows = table.num_rows
+    table = table.add_column(0, "id", pa.array([str(uuid.uuid4()) for _ in range(num_rows)], type=pa.string()))
+    table = table.add_column(1, "created_at", pa.array([datetime.now()] * num_rows, type=pa.timestamp("us")))
+    table = table.add_column(2, "version", pa.array([1] * num_rows, type=pa.int64()))
+
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def post(url: str, body: bytes, content_type: str) -> urllib3.BaseHTTPResponse:
+    """POST a prepared body through the shared connection pool"""
+    return HTTP.request("POST", url, body=body, headers={"Content-Type": content_type})
+
+def warm_up_connection():
+    """Open a pooled connection with a cheap request so no timed run pays the TCP connect"""
+    try:
+        HTTP.request("GET", ROOT_URL)
+    except urllib3.exceptions.HTTPError as e:
+        print(f"❌ Warm-up request failed: {e}")
+
+def fetch_arrow_row_count(url: str) -> int:
+    """Stream an Arrow IPC response batch by batch, holding at most one batch in memory"""
+    response = HTTP.request("GET", url, headers=READ_HEADERS, preload_content=False)
+    if response.status >= 400:
+        # Error bodies are short; reading one leaves the connection clean for the pool
+        detail = response.data.decode(errors="replace")
+        response.release_conn()
+        raise urllib3.exceptions.HTTPError(f"GET {url} returned {response.status}: {detail}")
+    try:
+        row_count = response.headers.get(ROW_COUNT_HEADER)
+        if row_count is not None:
+            # The server reports the row count; the body is still transferred, just not decoded
+            response.drain_conn()
+            return int(row_count)
+        # Arrow reads each message header and body separately; the buffer turns those
+        # small reads into few large socket reads
+        with ipc.open_stream(io.BufferedReader(response, buffer_size=STREAM_READ_BUFFER_BYTES)) as reader:
+            return sum(batch.num_rows for batch in reader)
+    except Exception:
+        # Unread bytes of an abandoned stream would poison the pooled socket; close it instead
+        response.close()
+        raise
+    finally:
+        response.release_conn()
+
+def run_load_data_fast(json_data: Optional[List[Dict[str, Any]]] = None):
         
-    # Load the JSON data
-    json_data = load_json_test_data()
+    # Load the JSON data unless the caller already has it
+    if json_data is None:
+        json_data = load_json_test_data()
 
     if not json_data:
         return {
@@ -58,7 +157,8 @@ def run_load_data_fast():
             "error": "Failed to load JSON test data"
         }
 
-    print(f"📊 Loaded {len(json_data):,} records from JSON file")
+    # Progress lines are collected and written once when the run finishes
+    log_buf: List[str] = [f"📊 Loaded {len(json_data):,} records from JSON file"]
 
     results = {
         "data_source": "mocked_response_100K-4.json",
@@ -66,41 +166,43 @@ def run_load_data_fast():
         "tests": {}
     }
 
-    # Test 2: High-performance bulk insert
-    print(f"\n🚀 Testing high-performance bulk insert with {len(json_data):,} real records...")
-    start_time = time.perf_counter()
+    # Test 2: High-performance bulk insert (Arrow IPC: binary columns instead of a JSON document)
+    log_buf.append(f"\n🚀 Testing high-performance bulk insert with {len(json_data):,} real records...")
+    start_ns = time.perf_counter_ns()
 
-    hp_response = requests.post(
-        f"{BASE_URL}/api/v1/high-performance/ultra-fast-bulk/{SCHEMA_NAME}",
-        json=json_data,
-        headers={"Content-Type": "application/json"}
-    )
+    hp_response = post(ARROW_BULK_URL, records_to_arrow_ipc(json_data), "application/vnd.apache.arrow.stream")
 
-    hp_duration = (time.perf_counter() - start_time) * 1000
+    hp_elapsed_ns = time.perf_counter_ns() - start_ns
+    hp_duration = hp_elapsed_ns / NS_PER_MS
 
-    if hp_response.status_code == 200:
-        hp_result = hp_response.json()
+    if hp_response.status == 200:
+        hp_result = orjson.loads(hp_response.data)
+        hp_throughput = len(json_data) * NS_PER_SECOND // hp_elapsed_ns if hp_elapsed_ns > 0 else 0
         results["tests"]["high_performance"] = {
             "success": True,
             "duration_ms": hp_duration,
-            "throughput_rps": hp_result.get("performance_metrics", {}).get("throughput_rps", 0),
-            "records_processed": len(json_data),
+            "throughput_rps": hp_throughput,
+            "records_processed": hp_result.get("records_processed", len(json_data)),
             "optimization": hp_result.get("optimization", "unknown")
         }
-        print(f"✅ High-performance insert completed: {hp_duration:.2f}ms ({hp_result.get('performance_metrics', {}).get('throughput_rps', 0):,} records/sec)")
+        log_buf.append(f"✅ High-performance insert completed: {hp_duration:.2f}ms ({hp_throughput:,} records/sec)")
     else:
         results["tests"]["high_performance"] = {
             "success": False,
-            "error": hp_response.text,
-            "status_code": hp_response.status_code
+            "error": hp_response.data.decode(errors="replace"),
+            "status_code": hp_response.status
         }
-        print(f"❌ High-performance insert failed: {hp_response.status_code}")
+        log_buf.append(f"❌ High-performance insert failed: {hp_response.status}")
+
+    sys.stdout.write("\n".join(log_buf) + "\n")
+    return results
 
 
-def run_load_data_slow():
+def run_load_data_slow(json_data: Optional[List[Dict[str, Any]]] = None):
         
-    # Load the JSON data
-    json_data = load_json_test_data()
+    # Load the JSON data unless the caller already has it
+    if json_data is None:
+        json_data = load_json_test_data()
 
     if not json_data:
         return {
@@ -108,7 +210,7 @@ def run_load_data_slow():
             "error": "Failed to load JSON test data"
         }
 
-    print(f"📊 Loaded {len(json_data):,} records from JSON file")
+    log_buf: List[str] = [f"📊 Loaded {len(json_data):,} records from JSON file"]
 
     results = {
         "data_source": "mocked_response_100K-4.json",
@@ -118,42 +220,79 @@ def run_load_data_slow():
 
 
     # Test 1: Traditional bulk insert
-    print(f"\n🔄 Testing traditional bulk insert with {len(json_data):,} real records...")
-    start_time = time.perf_counter()
+    log_buf.append(f"\n🔄 Testing traditional bulk insert with {len(json_data):,} real records...")
+    start_ns = time.perf_counter_ns()
 
-    traditional_response = requests.post(
-        f"{BASE_URL}/api/v1/records/bulk",
-        json={
+    traditional_response = post(
+        TRADITIONAL_BULK_URL,
+        orjson.dumps({
             "schema_name": SCHEMA_NAME,
             "data": json_data
-        },
-        headers={"Content-Type": "application/json"}
+        }),
+        "application/json"
     )
 
-    traditional_duration = (time.perf_counter() - start_time) * 1000
+    traditional_elapsed_ns = time.perf_counter_ns() - start_ns
+    traditional_duration = traditional_elapsed_ns / NS_PER_MS
 
-    if traditional_response.status_code == 201:
-        traditional_throughput = len(json_data) / (traditional_duration / 1000) if traditional_duration > 0 else 0
+    if traditional_response.status == 201:
+        traditional_throughput = len(json_data) * NS_PER_SECOND / traditional_elapsed_ns if traditional_elapsed_ns > 0 else 0
         results["tests"]["traditional"] = {
             "success": True,
             "duration_ms": traditional_duration,
             "throughput_rps": int(traditional_throughput),
             "records_processed": len(json_data)
         }
-        print(f"✅ Traditional insert completed: {traditional_duration:.2f}ms ({int(traditional_throughput):,} records/sec)")
+        log_buf.append(f"✅ Traditional insert completed: {traditional_duration:.2f}ms ({int(traditional_throughput):,} records/sec)")
     else:
         results["tests"]["traditional"] = {
             "success": False,
-            "error": traditional_response.text,
-            "status_code": traditional_response.status_code
+            "error": traditional_response.data.decode(errors="replace"),
+            "status_code": traditional_response.status
         }
-        print(f"❌ Traditional insert failed: {traditional_response.status_code}")
+        log_buf.append(f"❌ Traditional insert failed: {traditional_response.status}")
+
+    sys.stdout.write("\n".join(log_buf) + "\n")
+    return results
+
+
+def run_read_data():
+    """Read the loaded table back over the Arrow bulk-read endpoint"""
+    print(f"\n📥 Testing Arrow bulk read from {SCHEMA_NAME}...")
+    start_ns = time.perf_counter_ns()
+
+    try:
+        records_retrieved = fetch_arrow_row_count(ARROW_READ_URL)
+    except (urllib3.exceptions.HTTPError, pa.ArrowInvalid) as e:
+        print(f"❌ Arrow bulk read failed: {e}")
+        return {"success": False, "error": str(e)}
+
+    read_elapsed_ns = time.perf_counter_ns() - start_ns
+    read_duration = read_elapsed_ns / NS_PER_MS
+    read_throughput = records_retrieved * NS_PER_SECOND // read_elapsed_ns if read_elapsed_ns > 0 else 0
+    print(f"✅ Arrow bulk read completed: {records_retrieved:,} records in {read_duration:.2f}ms ({read_throughput:,} records/sec)")
+    return {
+        "success": True,
+        "duration_ms": read_duration,
+        "throughput_rps": read_throughput,
+        "records_retrieved": records_retrieved
+    }
+
 
+def main():
+    """Run the load paths one after the other, then read the table back"""
+    # The runs share the server and the target table, so they are timed sequentially; only the
+    # connection warm-up, which no run measures, overlaps with decoding the fixture
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        warm_up = executor.submit(warm_up_connection)
+        # Decode and normalize once; neither path mutates the records
+        json_data = load_json_test_data()
+        warm_up.result()
+    results = [run_load_data_fast(json_data), run_load_data_slow(json_data)]
+    results.append(run_read_data())
+    return results
 
 
 if __name__ == "__main__":
     print('Startin')
-    BASE_URL = "http://localhost:8080"
-    SCHEMA_NAME = "well_production"
-    run_load_data_fast()
-    run_load_data_slow()
+    main()
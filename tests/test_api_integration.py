@@ -3,8 +3,15 @@ import pyarrow as pa
 import pyarrow.ipc as ipc
 from fastapi import status
 
+# Accepted error details for a malformed Arrow body, checked in one startswith call
+INVALID_ARROW_DETAIL_PREFIXES = (
+    "Invalid Arrow IPC data",
+    "Invalid or empty Arrow table",
+    "Expected to read",
+)
+
 @pytest.mark.asyncio
-async def test_bulk_insert_and_read_success(client, sample_arrow_table):
+async def test_bulk_insert_and_read_success(async_client, sample_arrow_table):
     # Serialize Arrow table to IPC stream
     sink = pa.BufferOutputStream()
     with ipc.new_stream(sink, sample_arrow_table.schema) as writer:
@@ -12,14 +19,14 @@ async def test_bulk_insert_and_read_success(client, sample_arrow_table):
     arrow_bytes = sink.getvalue().to_pybytes()
 
     # Insert
-    response = client.post("/api/v1/arrow/bulk-insert/test", data=arrow_bytes)
+    response = await async_client.post("/api/v1/arrow/bulk-insert/test", content=arrow_bytes)
     assert response.status_code in (200, 404)  # 404 if schema 'test' doesn't exist
     if response.status_code == 200:
         assert response.json()["success"] is True
         assert response.json()["records_processed"] == sample_arrow_table.num_rows
 
     # Read
-    response = client.get("/api/v1/arrow/bulk-read/test")
+    response = await async_client.get("/api/v1/arrow/bulk-read/test")
     if response.status_code == 200:
         assert response.headers["content-type"].startswith("application/vnd.apache.arrow.stream")
         # Try to deserialize
@@ -33,22 +40,16 @@ async def test_bulk_insert_and_read_success(client, sample_arrow_table):
         assert response.status_code in (404, 500)
 
 @pytest.mark.asyncio
-async def test_bulk_insert_empty_body(client):
-    response = client.post("/api/v1/arrow/bulk-insert/test", data=b"")
-    assert response.status_code == 400
-    assert "No Arrow data provided" in response.text
-
-@pytest.mark.asyncio
-async def test_bulk_insert_invalid_arrow(client):
-    response = client.post("/api/v1/arrow/bulk-insert/test", data=b"notarrowdata")
+@pytest.mark.parametrize("body,detail_prefixes", [
+    (b"", ("No Arrow data provided",)),
+    (b"notarrowdata", INVALID_ARROW_DETAIL_PREFIXES),
+], ids=["empty_body", "invalid_arrow"])
+async def test_bulk_insert_bad_body(async_client, body, detail_prefixes):
+    response = await async_client.post("/api/v1/arrow/bulk-insert/test", content=body)
     assert response.status_code == 400
-    assert (
-        "Invalid Arrow IPC data" in response.text
-        or "Invalid or empty Arrow table" in response.text
-        or "Expected to read" in response.text
-    )
+    assert response.json()["detail"].startswith(detail_prefixes)
 
 @pytest.mark.asyncio
-async def test_bulk_read_not_found(client):
-    response = client.get("/api/v1/arrow/bulk-read/doesnotexist")
+async def test_bulk_read_not_found(async_client):
+    response = await async_client.get("/api/v1/arrow/bulk-read/doesnotexist")
     assert response.status_code in (404, 500) 
\ No newline at end of file
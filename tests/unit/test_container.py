@@ -1,18 +1,25 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from app.container.container import Container
 
-@pytest.mark.asyncio
-async def test_container_startup_and_shutdown():
+@pytest.fixture
+def mocked_container(monkeypatch):
+    # Patch the container's I/O entry points once per test instead of stacking patch.object blocks
     container = Container()
-    with patch.object(container.connection_pool, 'initialize', new=AsyncMock()) as mock_init, \
-         patch.object(container.connection_pool, 'close', new=AsyncMock()) as mock_close, \
-         patch.object(container.schema_repository, 'initialize', new=AsyncMock()) as mock_repo_init:
-        await container.startup()
-        mock_init.assert_awaited()
-        mock_repo_init.assert_awaited()
-        await container.shutdown()
-        mock_close.assert_awaited()
+    mocks = MagicMock(init=AsyncMock(), close=AsyncMock(), repo_init=AsyncMock())
+    monkeypatch.setattr(container.connection_pool, 'initialize', mocks.init)
+    monkeypatch.setattr(container.connection_pool, 'close', mocks.close)
+    monkeypatch.setattr(container.schema_repository, 'initialize', mocks.repo_init)
+    return container, mocks
+
+@pytest.mark.asyncio
+async def test_container_startup_and_shutdown(mocked_container):
+    container, mocks = mocked_container
+    await container.startup()
+    mocks.init.assert_awaited()
+    mocks.repo_init.assert_awaited()
+    await container.shutdown()
+    mocks.close.assert_awaited()
 
 def test_container_dependencies():
     container = Container()
@@ -25,20 +32,16 @@ def test_container_dependencies():
     assert container.create_ultra_fast_bulk_data_use_case is not None
 
 @pytest.mark.asyncio
-async def test_container_startup_non_file_schema_repo():
-    container = Container()
+async def test_container_startup_non_file_schema_repo(mocked_container):
+    container, mocks = mocked_container
     container.schema_repository = MagicMock()  # Not FileSchemaRepository
-    with patch.object(container.connection_pool, 'initialize', new=AsyncMock()) as mock_init:
-        await container.startup()
-        mock_init.assert_awaited()
+    await container.startup()
+    mocks.init.assert_awaited()
 
 @pytest.mark.asyncio
-async def test_container_double_startup_shutdown():
-    container = Container()
-    with patch.object(container.connection_pool, 'initialize', new=AsyncMock()) as mock_init, \
-         patch.object(container.connection_pool, 'close', new=AsyncMock()) as mock_close, \
-         patch.object(container.schema_repository, 'initialize', new=AsyncMock()) as mock_repo_init:
-        await container.startup()
-        await container.startup()  # Should not error
-        await container.shutdown()
-        await container.shutdown()  # Should not error 
\ No newline at end of file
+async def test_container_double_startup_shutdown(mocked_container):
+    container, _ = mocked_container
+    await container.startup()
+    await container.startup()  # Should not error
+    await container.shutdown()
+    await container.shutdown()  # Should not error
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pytest
+from pydantic import ValidationError
 from app.domain.entities.schema import Schema, SchemaProperty
-from app.domain.exceptions import InvalidDataException, SchemaNotFoundException, RecordNotFoundException, SchemaValidationException
+from app.domain.exceptions import DomainException, InvalidDataException, SchemaNotFoundException, RecordNotFoundException, SchemaValidationException
 from app.domain.repositories.schema_repository import ISchemaRepository
 
 class DummySchemaRepository(ISchemaRepository):
@@ -33,21 +34,33 @@ def test_schema_property_and_schema():
     with pytest.raises(InvalidDataException):
         schema.get_composite_key_from_data({})
 
-def test_domain_exceptions():
-    with pytest.raises(SchemaNotFoundException):
-        raise SchemaNotFoundException()
-    with pytest.raises(RecordNotFoundException):
-        raise RecordNotFoundException()
-    with pytest.raises(InvalidDataException):
-        raise InvalidDataException()
-    with pytest.raises(SchemaValidationException):
-        raise SchemaValidationException()
+@pytest.mark.parametrize("exc_type", [
+    SchemaNotFoundException,
+    RecordNotFoundException,
+    InvalidDataException,
+    SchemaValidationException,
+])
+def test_domain_exceptions(exc_type):
+    with pytest.raises(DomainException):
+        raise exc_type()
 
-def test_schema_repository_interface():
+@pytest.mark.asyncio
+async def test_schema_repository_interface():
     repo = DummySchemaRepository()
-    import asyncio
-    assert asyncio.run(repo.get_schema_by_name("any")) is None
-    assert asyncio.run(repo.get_all_schemas()) == []
+    assert await repo.get_schema_by_name("any") is None
+    assert await repo.get_all_schemas() == []
+
+@pytest.fixture(scope="module")
+def schemas_by_type():
+    # One single-field schema per property type, shared by all validate_data cases
+    return {
+        type_: Schema(
+            name="S", description="", table_name="T",
+            properties=[SchemaProperty(name="field", type=type_, db_type="DUMMY", required=True)],
+            primary_key=None
+        )
+        for type_ in ("string", "integer", "number", "boolean", "array", "object")
+    }
 
 @pytest.mark.parametrize("type_,value,should_raise", [
     ("string", "abc", False),
@@ -64,11 +77,8 @@ def test_schema_repository_interface():
     ("object", {"a":1}, False),
     ("object", "notobject", True),
 ])
-def test_schema_validate_data_types(type_, value, should_raise):
-    prop = SchemaProperty(name="field", type=type_, db_type="DUMMY", required=True)
-    schema = Schema(
-        name="S", description="", table_name="T", properties=[prop], primary_key=None
-    )
+def test_schema_validate_data_types(schemas_by_type, type_, value, should_raise):
+    schema = schemas_by_type[type_]
     if should_raise:
         with pytest.raises(InvalidDataException):
             schema.validate_data({"field": value})
@@ -98,4 +108,26 @@ def test_schema_composite_key_missing_pk():
     assert schema.get_composite_key_from_data(data) == data
     # One missing
     with pytest.raises(InvalidDataException):
-        schema.get_composite_key_from_data({"id1": "a"}) 
\ No newline at end of file
+        schema.get_composite_key_from_data({"id1": "a"}) 
+
+def test_schema_composite_key_ignores_non_pk_property():
+    prop1 = SchemaProperty(name="id1", type="string", db_type="VARCHAR", required=True, primary_key=True)
+    prop2 = SchemaProperty(name="id2", type="string", db_type="VARCHAR", required=False, primary_key=False)
+    schema = Schema(
+        name="S", description="", table_name="T", properties=[prop1, prop2], primary_key=["id1", "id2"]
+    )
+    assert schema.primary_key_property_names == frozenset({"id1"})
+    # id2 is listed in the key but not flagged, so it may be absent
+    assert schema.get_composite_key_from_data({"id1": "a"}) == {"id1": "a"}
+    with pytest.raises(InvalidDataException, match="id1"):
+        schema.get_composite_key_from_data({"id2": "b"})
+
+def test_schema_property_lookups():
+    props = [
+        SchemaProperty(name="b", type="string", db_type="VARCHAR"),
+        SchemaProperty(name="a", type="integer", db_type="BIGINT"),
+    ]
+    schema = Schema(name="S", description="", table_name="T", properties=props, primary_key=None)
+    assert schema.property_names == ("b", "a")
+    with pytest.raises(ValidationError):
+        schema.table_name = "other"
@@ -1,11 +1,20 @@
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.infrastructure.persistence.duckdb.connection_pool import AsyncDuckDBPool
 from app.infrastructure.persistence.duckdb.schema_manager import DuckDBSchemaManager
 from app.infrastructure.persistence.repositories.file_schema_repository import FileSchemaRepository
 from app.infrastructure.persistence.arrow_bulk_operations import ArrowBulkOperations
 from app.domain.entities.schema import Schema
+from app.infrastructure.persistence.partitioning.partition_config import PartitionConfig, PartitionStrategy
+from app.infrastructure.persistence.partitioning.partition_manager import PartitionManager, run_on_cursor
+from app.infrastructure.persistence.partitioning.partition_migrator import PartitionMigrator
+from app.infrastructure.persistence.partitioning.partition_utilities import PartitionUtilities
+from app.domain.entities.schema import SchemaProperty
+from datetime import datetime
+import json
+import time
 import pandas as pd
 import pyarrow as pa
 from fastapi import status
@@ -14,12 +23,22 @@ from app.infrastructure.web.routers.arrow_performance_data import router
 from app.infrastructure.web.arrow import ArrowResponse
 from fastapi import FastAPI
 import pyarrow.ipc as ipc
+import duckdb
 from app.container.container import container
+from app.config.settings import settings, build_duckdb_set_statements, format_duckdb_setting
+from app.config.logging_config import logger, sanitize_log_message
 
 app = FastAPI()
 app.include_router(router)
 app.container = container
 
+# Shared request payload, built once for the module; Arrow tables are immutable
+ARROW_TABLE = pa.table({"a": [1, 2, 3]})
+_sink = pa.BufferOutputStream()
+with ipc.new_stream(_sink, ARROW_TABLE.schema) as _writer:
+    _writer.write_table(ARROW_TABLE)
+ARROW_BYTES = _sink.getvalue().to_pybytes()
+
 @pytest.mark.asyncio
 async def test_async_duckdb_pool_initialize_and_close():
     pool = AsyncDuckDBPool()
@@ -31,13 +50,25 @@ async def test_async_duckdb_pool_initialize_and_close():
         mock_close.assert_awaited()
 
 @pytest.mark.asyncio
-async def test_duckdb_schema_manager_ensure_tables_exist():
+async def test_async_duckdb_pool_real_connection(duckdb_db, monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_PATH", duckdb_db)
+    monkeypatch.setattr(settings, "DUCKDB_ARROW_EXTENSION_ENABLED", False)
+    pool = AsyncDuckDBPool()
+    await pool.initialize()
+    try:
+        async with pool.acquire() as conn:
+            assert conn.execute("SELECT 42").fetchone()[0] == 42
+    finally:
+        await pool.close()
+    assert not pool.is_connected()
+
+@pytest.mark.asyncio
+async def test_duckdb_schema_manager_ensure_tables_exist(sample_schema):
     pool = MagicMock()
     manager = DuckDBSchemaManager(connection_pool=pool)
     manager.connection_pool.acquire = AsyncMock()
-    schema = Schema(name="s", description="d", table_name="t", properties=[], primary_key=None)
     with patch.object(manager, 'ensure_tables_exist', new=AsyncMock()) as mock_ensure:
-        await manager.ensure_tables_exist([schema])
+        await manager.ensure_tables_exist([sample_schema])
         mock_ensure.assert_awaited()
 
 @pytest.mark.asyncio
@@ -58,33 +89,46 @@ async def test_file_schema_repository():
     assert isinstance(await repo.get_all_schemas(), list)
 
 @pytest.mark.asyncio
-async def test_arrow_bulk_operations():
+async def test_arrow_bulk_operations(sample_schema):
     pool = MagicMock()
     ops = ArrowBulkOperations(connection_pool=pool)
-    schema = Schema(name="s", description="d", table_name="t", properties=[], primary_key=None)
     df = pd.DataFrame({"a": [1,2]})
     table = pa.Table.from_pandas(df)
     with patch.object(ops, 'bulk_insert_from_dataframe', new=AsyncMock()) as mock_insert_df:
-        await ops.bulk_insert_from_dataframe(schema, df)
+        await ops.bulk_insert_from_dataframe(sample_schema, df)
         mock_insert_df.assert_awaited()
     with patch.object(ops, 'bulk_insert_from_arrow_table', new=AsyncMock()) as mock_insert_arrow:
-        await ops.bulk_insert_from_arrow_table(schema, table)
+        await ops.bulk_insert_from_arrow_table(sample_schema, table)
         mock_insert_arrow.assert_awaited()
     with patch.object(ops, 'bulk_read_to_arrow_table', new=AsyncMock(return_value=table)) as mock_read_arrow:
-        result = await ops.bulk_read_to_arrow_table(schema)
+        result = await ops.bulk_read_to_arrow_table(sample_schema)
         assert isinstance(result, pa.Table)
     with patch.object(ops, 'bulk_read_to_dataframe', new=AsyncMock(return_value=df)) as mock_read_df:
-        result = await ops.bulk_read_to_dataframe(schema)
+        result = await ops.bulk_read_to_dataframe(sample_schema)
         assert isinstance(result, pd.DataFrame)
 
 @pytest.mark.asyncio
-async def test_arrow_bulk_operations_error():
+async def test_arrow_bulk_operations_roundtrip(duckdb_conn):
+    @asynccontextmanager
+    async def acquire():
+        yield duckdb_conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    ops = ArrowBulkOperations(connection_pool=pool)
+    schema = Schema(name="s", description="d", table_name="roundtrip", properties=[], primary_key=None)
+    duckdb_conn.execute('CREATE OR REPLACE TABLE "roundtrip" (a BIGINT PRIMARY KEY)')
+    await ops.bulk_insert_from_arrow_table(schema, pa.table({"a": [1, 2, 3]}))
+    result = await ops.bulk_read_to_arrow_table(schema)
+    assert result.column("a").to_pylist() == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_arrow_bulk_operations_error(sample_schema):
     pool = MagicMock()
     ops = ArrowBulkOperations(connection_pool=pool)
-    schema = Schema(name="s", description="d", table_name="t", properties=[], primary_key=None)
     with patch.object(ops, 'bulk_insert_from_arrow_table', new=AsyncMock(side_effect=Exception("fail"))):
         with pytest.raises(Exception):
-            await ops.bulk_insert_from_arrow_table(schema, pa.table({"a": [1]}))
+            await ops.bulk_insert_from_arrow_table(sample_schema, pa.table({"a": [1]}))
 
 @pytest.mark.asyncio
 async def test_concurrent_duckdb_pool():
@@ -97,11 +141,6 @@ async def test_concurrent_duckdb_pool():
 async def test_bulk_insert_success(monkeypatch):
     client = TestClient(app)
     schema_name = "test_schema"
-    df = pa.table({"a": [1, 2, 3]})
-    sink = pa.BufferOutputStream()
-    with ipc.new_stream(sink, df.schema) as writer:
-        writer.write_table(df)
-    arrow_bytes = sink.getvalue().to_pybytes()
 
     async def mock_execute_from_arrow_table(schema_name, arrow_table):
         assert schema_name == "test_schema"
@@ -113,10 +152,10 @@ async def test_bulk_insert_success(monkeypatch):
         "execute_from_arrow_table",
         new=AsyncMock(side_effect=mock_execute_from_arrow_table),
     ):
-        response = client.post(f"/arrow/bulk-insert/{schema_name}", data=arrow_bytes)
+        response = client.post(f"/arrow/bulk-insert/{schema_name}", data=ARROW_BYTES)
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["success"] is True
-        assert response.json()["records_processed"] == 3
+        assert response.json()["records_processed"] == ARROW_TABLE.num_rows
 
 @pytest.mark.asyncio
 async def test_bulk_insert_no_data(monkeypatch):
@@ -130,11 +169,10 @@ async def test_bulk_insert_no_data(monkeypatch):
 async def test_bulk_read_success(monkeypatch):
     client = TestClient(app)
     schema_name = "test_schema"
-    df = pa.table({"a": [1, 2, 3]})
 
     async def mock_read_to_arrow_table(schema_name):
         assert schema_name == "test_schema"
-        return df
+        return ARROW_TABLE
 
     with patch.object(
         app.container.create_ultra_fast_bulk_data_use_case,
@@ -143,4 +181,210 @@ async def test_bulk_read_success(monkeypatch):
     ):
         response = client.get(f"/arrow/bulk-read/{schema_name}")
         assert response.status_code == status.HTTP_200_OK
-        assert response.content  # Should return Arrow IPC stream 
\ No newline at end of file
+        assert response.content  # Should return Arrow IPC stream
+        assert response.headers["x-total-count"] == str(ARROW_TABLE.num_rows)
+
+@pytest.mark.parametrize("strategy,partition_name,expected_start", [
+    (PartitionStrategy.YEARLY, "partition_2024", datetime(2024, 1, 1)),
+    (PartitionStrategy.MONTHLY, "partition_2024_12", datetime(2024, 12, 1)),
+    (PartitionStrategy.DAILY, "partition_2024_02_29", datetime(2024, 2, 29)),
+])
+def test_partition_name_round_trip(strategy, partition_name, expected_start):
+    config = PartitionConfig(strategy=strategy)
+    start_date, end_date = config.get_date_range_for_partition(partition_name)
+    assert start_date == expected_start
+    assert config.get_partition_name(start_date) == partition_name
+    assert config.get_partition_name(end_date) == partition_name
+    with pytest.raises(ValueError):
+        config.get_date_range_for_partition("bogus_2024")
+
+@pytest.mark.parametrize("timestamp", [
+    "2024-03-05T10:00:00+00:00",
+    "2024-03-05T10:00:00Z",
+    "2024-03-05T10:00:00.123456",
+    "2024-03-05 10:00:00",
+    "2024-03-05",
+    "2024-3-5",
+])
+def test_partition_for_timestamp_formats(timestamp):
+    manager = PartitionManager(PartitionConfig(strategy=PartitionStrategy.MONTHLY))
+    assert manager.get_partition_for_timestamp(timestamp) == "partition_2024_03"
+
+def test_build_duckdb_set_statements():
+    statements = build_duckdb_set_statements({
+        "memory_limit": "8GB",
+        "threads": 4,
+        "enable_object_cache": True,
+        "disabled_optimizers": "",
+        "unset": None,
+    })
+    assert statements == (
+        "SET memory_limit = '8GB'",
+        "SET threads = 4",
+        "SET enable_object_cache = true",
+    )
+
+@pytest.mark.parametrize("key,value,expected", [
+    ("memory_limit", "8GB", "SET memory_limit = '8GB'"),
+    ("threads", 4, "SET threads = 4"),
+    ("enable_object_cache", False, "SET enable_object_cache = false"),
+])
+def test_format_duckdb_setting(key, value, expected):
+    assert format_duckdb_setting(value, key) == expected
+
+def test_duckdb_performance_config_is_not_shared():
+    config = settings.DUCKDB_PERFORMANCE_CONFIG
+    config["threads"] = 1
+    config.pop("memory_limit")
+    assert settings.DUCKDB_PERFORMANCE_CONFIG["threads"] == 4
+    assert "memory_limit" in settings.DUCKDB_RUNTIME_CONFIG
+
+def test_sanitize_log_message():
+    assert sanitize_log_message("plain ascii") == "plain ascii"
+    assert sanitize_log_message("✅ done → next") == "[CHECK] done -> next"
+
+def test_logger_sanitizes_through_real_handlers(caplog):
+    with caplog.at_level("INFO", logger="app"):
+        logger.info("🚀 started")
+    assert caplog.messages[-1] == "[ROCKET] started"
+
+@pytest.mark.asyncio
+async def test_acquired_partition_connection_survives_pool_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DUCKDB_ARROW_EXTENSION_ENABLED", False)
+    manager = PartitionManager(PartitionConfig(base_partition_path=str(tmp_path), max_partitions_in_memory=1))
+    try:
+        async with manager.acquire_partition_connection("partition_2024_01") as conn:
+            # Opening more partitions than the pool holds must not close the connection in use
+            await manager.get_partition_connection("partition_2024_02")
+            await manager.get_partition_connection("partition_2024_03")
+            assert conn.execute("SELECT 42").fetchone()[0] == 42
+        # Once released it is the oldest idle connection again and the next open trims it
+        await manager.get_partition_connection("partition_2024_04")
+        assert "partition_2024_01" not in manager._partition_connections
+    finally:
+        await manager.close_all_connections()
+
+@pytest.mark.asyncio
+async def test_concurrent_partition_reads_share_one_connection(tmp_path, monkeypatch):
+    # Overlapping page reads on one partition, as two concurrent get_all calls issue them
+    monkeypatch.setattr(settings, "DUCKDB_ARROW_EXTENSION_ENABLED", False)
+    manager = PartitionManager(PartitionConfig(base_partition_path=str(tmp_path)))
+
+    def fetch_page(cursor, limit):
+        count = cursor.execute("SELECT count(*) FROM wp WHERE n < ?", [500]).fetchone()[0]
+        rows = cursor.execute("SELECT n FROM wp ORDER BY n LIMIT ?", [limit]).fetchall()
+        return count, len(rows)
+
+    try:
+        async with manager.acquire_partition_connection("partition_2024_01") as conn:
+            conn.execute("CREATE TABLE wp AS SELECT range AS n FROM range(1000)")
+            results = await asyncio.gather(*(
+                run_on_cursor(conn, fetch_page, limit) for limit in (10, 20) * 100
+            ))
+        assert results == [(500, 10), (500, 20)] * 100
+    finally:
+        await manager.close_all_connections()
+
+@pytest.mark.asyncio
+async def test_partition_migration_beyond_connection_pool_limit(tmp_path, monkeypatch):
+    # 18 monthly partitions through a pool of 2 connections, with concurrent partition inserts;
+    # rows with a NULL period fall back to created_at and reopen partitions from earlier batches
+    monkeypatch.setattr(settings, "DATABASE_PATH", str(tmp_path / "main.duckdb"))
+    monkeypatch.setattr(settings, "DUCKDB_ARROW_EXTENSION_ENABLED", False)
+    schema = Schema(
+        name="wp", description="d", table_name="wp",
+        properties=[
+            SchemaProperty(name="well_code", type="integer", db_type="BIGINT"),
+            SchemaProperty(name="production_period", type="string", db_type="TIMESTAMP"),
+        ],
+    )
+    row_count = 360
+    conn = duckdb.connect(settings.DATABASE_PATH)
+    conn.execute("CREATE TABLE wp (id VARCHAR PRIMARY KEY, created_at TIMESTAMP, version INTEGER, "
+                 "well_code BIGINT, production_period TIMESTAMP)")
+    conn.executemany("INSERT INTO wp VALUES (?, ?, 1, ?, ?)", [
+        (f"r{n}", datetime(2023, 1 + n % 3, 1), n,
+         None if n % 5 == 0 else datetime(2023 + (n % 18) // 12, 1 + (n % 18) % 12, 1))
+        for n in range(row_count)
+    ])
+    conn.close()
+
+    config = PartitionConfig(
+        base_partition_path=str(tmp_path / "partitions"),
+        main_database_path=str(tmp_path / "manager.duckdb"),
+        max_partitions_in_memory=2,
+    )
+    pool = AsyncDuckDBPool()
+    migrator = PartitionMigrator(pool, config)
+    await pool.initialize()
+    await migrator.initialize()
+    try:
+        stats = await migrator.migrate_table_to_partitions(schema, batch_size=40)
+    finally:
+        await migrator.close()
+        await pool.close()
+
+    assert stats["errors"] == []
+    assert stats["migrated_records"] == row_count
+    assert len(config.list_existing_partitions()) > config.max_partitions_in_memory
+
+@pytest.mark.asyncio
+async def test_partition_batch_failure_waits_for_sibling_inserts(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DUCKDB_ARROW_EXTENSION_ENABLED", False)
+    schema = Schema(
+        name="wp", description="d", table_name="wp",
+        properties=[SchemaProperty(name="production_period", type="string", db_type="TIMESTAMP")],
+    )
+    config = PartitionConfig(base_partition_path=str(tmp_path), main_database_path=str(tmp_path / "main.duckdb"))
+    migrator = PartitionMigrator(AsyncDuckDBPool(), config)
+    await migrator.initialize()
+    insert_into_partition = migrator._insert_into_partition
+    finished = []
+
+    async def insert_or_fail(schema, partition_name, columns, rows):
+        if partition_name == "partition_2024_01":
+            raise RuntimeError("insert failed")
+        # Still inside its worker thread when the failing insert raises
+        await asyncio.to_thread(time.sleep, 0.1)
+        await insert_into_partition(schema, partition_name, columns, rows)
+        finished.append(partition_name)
+
+    monkeypatch.setattr(migrator, "_insert_into_partition", insert_or_fail)
+    rows = [(f"r{month}", datetime(2024, month, 1), 1, datetime(2024, month, 1)) for month in (1, 2, 3)]
+    description = [("id",), ("created_at",), ("version",), ("production_period",)]
+    try:
+        with pytest.raises(RuntimeError, match="insert failed"):
+            await migrator._migrate_batch(schema, rows, description, {})
+        assert sorted(finished) == ["partition_2024_02", "partition_2024_03"]
+    finally:
+        await migrator.close()
+
+@pytest.mark.parametrize("partition_names", [
+    [],
+    ["partition_2024_01"],
+    ["partition_2024_01", "partition_2024_02", "partition_2024_03"],
+])
+def test_write_partition_metadata_matches_json_dumps(tmp_path, partition_names):
+    for partition_name in partition_names:
+        (tmp_path / f"{partition_name}.duckdb").write_bytes(b"")
+    utilities = PartitionUtilities(PartitionConfig(base_partition_path=str(tmp_path)))
+    output_file = tmp_path / "metadata.json"
+    with open(output_file, "w") as f:
+        assert utilities.write_partition_metadata(f) == len(partition_names)
+    written = output_file.read_text()
+    document = json.loads(written)
+    # The streamed document must be byte-for-byte what json.dumps(indent=2) renders for it
+    assert written == json.dumps(document, indent=2)
+    assert [partition["name"] for partition in document["partitions"]] == partition_names
+
+@pytest.mark.asyncio
+async def test_export_partition_metadata_leaves_no_partial_file(tmp_path):
+    (tmp_path / "partition_2024_01.duckdb").write_bytes(b"")
+    utilities = PartitionUtilities(PartitionConfig(base_partition_path=str(tmp_path)))
+    output_file = tmp_path / "metadata.json"
+    output_file.write_text("previous export")
+    with patch.object(PartitionUtilities, "_collect_partition_metadata", return_value={"bad": object()}):
+        result = await utilities.export_partition_metadata(str(output_file))
+    assert result["success"] is False
+    assert output_file.read_text() == "previous export"
+    assert not (tmp_path / "metadata.json.tmp").exists()
@@ -1,39 +1,48 @@
-import json
-from collections import defaultdict
+import orjson
 from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+
+COMPOSITE_KEY_COLUMNS = ["field_code", "well_code", "production_period"]
 
 def verify_duplicates(file_path: str = "external/mocked_response_duplicates.json"):
     # Load the JSON file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
     
     records = data.get('value', [])
     total_records = len(records)
+    if not records:
+        print("Total records in file: 0")
+        return
     
-    # Create composite keys and count occurrences
-    composite_keys = defaultdict(list)
-    for idx, record in enumerate(records):
-        key = (
-            record.get('field_code'),
-            record.get('well_code'),
-            record.get('production_period')
-        )
-        composite_keys[key].append(idx)
+    # Group composite keys in Arrow instead of a per-record Python dict loop; only the key
+    # columns are converted, so the other fields of every record never become Arrow arrays
+    keys_table = pa.table({
+        column: [record.get(column) for record in records]
+        for column in COMPOSITE_KEY_COLUMNS
+    })
+    keys_table = keys_table.append_column("index", pa.array(range(total_records), type=pa.int64()))
+    composite_keys = keys_table.group_by(COMPOSITE_KEY_COLUMNS, use_threads=False).aggregate(
+        [("index", "list"), ("index", "count")]
+    )
     
     # Count duplicates
-    duplicates = {key: indices for key, indices in composite_keys.items() if len(indices) > 1}
-    total_duplicates = sum(len(indices) - 1 for indices in duplicates.values())
+    duplicates = composite_keys.filter(pc.greater(composite_keys["index_count"], 1))
+    total_duplicates = pc.sum(pc.subtract(duplicates["index_count"], 1)).as_py() or 0
     
     # Print results
     print(f"Total records in file: {total_records}")
-    print(f"Unique records: {len(composite_keys)}")
+    print(f"Unique records: {composite_keys.num_rows}")
     print(f"Total duplicates: {total_duplicates}")
-    print(f"Records with duplicates: {len(duplicates)}")
+    print(f"Records with duplicates: {duplicates.num_rows}")
     
     # Print some example duplicates
-    if duplicates:
+    if duplicates.num_rows:
         print("\nExample duplicates:")
-        for key, indices in list(duplicates.items())[:3]:
+        for row in duplicates.slice(0, 3).to_pylist():
+            key = tuple(row[column] for column in COMPOSITE_KEY_COLUMNS)
+            indices = row["index_list"]
             print(f"\nComposite key: {key}")
             print(f"Found at indices: {indices}")
             for idx in indices: